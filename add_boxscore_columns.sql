@@ -41,6 +41,30 @@ ELSE
 BEGIN
     PRINT 'Home_runs column already exists in boxscore table';
 END
+GO
+
+-- Add persisted extra_base_hits column if it doesn't exist
+IF NOT EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
+               WHERE TABLE_NAME = 'boxscore' AND COLUMN_NAME = 'extra_base_hits')
+BEGIN
+    ALTER TABLE boxscore ADD extra_base_hits AS (ISNULL(doubles, 0) + ISNULL(triples, 0) + ISNULL(home_runs, 0)) PERSISTED;
+    PRINT 'Added extra_base_hits column to boxscore table';
+END
+ELSE
+BEGIN
+    PRINT 'Extra_base_hits column already exists in boxscore table';
+END
+GO
+
+-- Index the computed column so TOP-N extra base hit lookups avoid a scan and sort
+-- (filtered indexes cannot reference computed columns, so this one is unfiltered)
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_boxscore_xbh')
+BEGIN
+    CREATE INDEX IX_boxscore_xbh ON boxscore(extra_base_hits DESC)
+    INCLUDE (game_id, player_id, at_bats, hits, doubles, triples, home_runs, rbi);
+    PRINT 'Created IX_boxscore_xbh index on boxscore table';
+END
+GO
 
 -- Verify the new columns
 SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
@@ -4,90 +4,74 @@ Add Game Type Support to MLB Data Pipeline
 Adds game_type and series_description columns to the games table and updates the data processing.
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
+from src.database import schema_cache
 
 def add_game_type_support():
     """Add game type fields to the games table."""
     db = DatabaseConnection()
     
-    # SQL commands to add game type columns
-    updates = [
-        # Add game_type column
-        """
-        IF NOT EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS 
-                       WHERE TABLE_NAME = 'games' AND COLUMN_NAME = 'game_type')    
-        BEGIN
-            ALTER TABLE games ADD game_type NVARCHAR(10) DEFAULT NULL;
-            PRINT 'Added game_type column to games table';
-        END
-        ELSE
-        BEGIN
-            PRINT 'Game_type column already exists in games table';
-        END
-        """,
-        
-        # Add series_description column
-        """
-        IF NOT EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS
-                       WHERE TABLE_NAME = 'games' AND COLUMN_NAME = 'series_description')    
-        BEGIN
-            ALTER TABLE games ADD series_description NVARCHAR(100) DEFAULT NULL;
-            PRINT 'Added series_description column to games table';
-        END
-        ELSE
-        BEGIN
-            PRINT 'Series_description column already exists in games table';
-        END
-        """,
-        
-        # Add official_date column
-        """
-        IF NOT EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS
-                       WHERE TABLE_NAME = 'games' AND COLUMN_NAME = 'official_date')    
-        BEGIN
-            ALTER TABLE games ADD official_date DATE DEFAULT NULL;
-            PRINT 'Added official_date column to games table';
-        END
-        ELSE
-        BEGIN
-            PRINT 'Official_date column already exists in games table';
-        END
-        """
+    # Columns required for game type support
+    game_type_columns = [
+        ('game_type', 'game_type NVARCHAR(10) DEFAULT NULL'),
+        ('series_description', 'series_description NVARCHAR(100) DEFAULT NULL'),
+        ('official_date', 'official_date DATE DEFAULT NULL'),
     ]
     
     try:
         print("Adding game type support to games table...")
         
-        for i, update_sql in enumerate(updates, 1):
-            print(f"Executing update {i}/3...")
-            db.execute_query(update_sql)
+        # Fetch the current schema once; it doubles as the verification
+        # listing unless columns actually have to be added
+        result = schema_cache.get_columns(db, 'games')
+        existing = {row[0] for row in result}
+        
+        missing = [(name, ddl) for name, ddl in game_type_columns if name not in existing]
+        for name, _ in game_type_columns:
+            if name in existing:
+                print(f"{name} column already exists in games table")
         
-        # Verify the schema
-        verify_sql = """
-        SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_NAME = 'games'
-        ORDER BY ORDINAL_POSITION
-        """
+        if missing:
+            # SQL Server accepts several columns in a single ALTER TABLE ADD; it
+            # commits (or rolls back) through SQLAlchemy's transaction, so a
+            # failure leaves the schema untouched
+            db.execute_transaction([f"""
+            SET XACT_ABORT ON;
+            ALTER TABLE games ADD {', '.join(ddl for _, ddl in missing)};
+            """])
+            for name, _ in missing:
+                print(f"Added {name} column to games table")
+            
+            schema_cache.invalidate()
+            
+            print("\nVerifying updated schema:")
+            result = schema_cache.get_columns(db, 'games')
         
-        print("\nVerifying updated schema:")
-        result = db.fetch_results(verify_sql)
+        # Indexes for the game type analyzer: type + date range lookups, and the
+        # per-type/series summary (covering, so it never touches the base table)
+        db.execute_transaction(["""
+        IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_games_type_date' AND object_id = OBJECT_ID('games'))
+        BEGIN
+            CREATE INDEX IX_games_type_date ON games (game_type, game_date)
+            INCLUDE (official_date, series_description, game_status, home_score, away_score, home_team_id, away_team_id);
+        END
+        
+        IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_games_type_series' AND object_id = OBJECT_ID('games'))
+        BEGIN
+            CREATE INDEX IX_games_type_series ON games (game_type, series_description) INCLUDE (game_date);
+        END
+        """])
+        print("Game type indexes are in place")
         
         print("\nGames table columns:")
         print("-" * 70)
         print(f"{'Column Name':<20} {'Data Type':<15} {'Nullable':<10} {'Default':<15}")
         print("-" * 70)
         
-        for row in result:
-            column_name = row[0]
-            data_type = row[1]
-            is_nullable = row[2]
-            column_default = row[3] if row[3] else ''
-            print(f"{column_name:<20} {data_type:<15} {is_nullable:<10} {column_default:<15}")
+        print("\n".join(
+            f"{column_name:<20} {data_type:<15} {is_nullable:<10} {column_default or '':<15}"
+            for column_name, data_type, is_nullable, column_default in result
+        ))
         
         print(f"\nSchema update completed successfully!")
         print(f"Total columns in games table: {len(result)}")
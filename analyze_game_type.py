@@ -3,11 +3,7 @@
 Analyze Game Type Data
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
 
 def analyze_game_type_data():
     """Analyze the game_type column data in the games table."""
@@ -22,19 +18,20 @@ def analyze_game_type_data():
         
         # Check distinct game_type values
         result = db.fetch_results("""
-        SELECT game_type, COUNT(*) as count
+        SELECT game_type,
+               COUNT(*) as count,
+               CAST(100.0 * COUNT(*) / SUM(COUNT(*)) OVER () AS DECIMAL(5,1)) as percentage,
+               SUM(COUNT(*)) OVER () as total_games
         FROM games 
         GROUP BY game_type 
         ORDER BY COUNT(*) DESC
         """)
         
         print("Game Type Distribution:")
-        total_games = sum(row[1] for row in result)
-        for row in result:
-            game_type, count = row
-            percentage = (count / total_games) * 100 if total_games > 0 else 0
-            print(f"  {game_type or 'NULL'}: {count} games ({percentage:.1f}%)")
+        for game_type, count, percentage, _ in result:
+            print(f"  {game_type or 'NULL'}: {count} games ({percentage}%)")
         
+        total_games = result[0][3] if result else 0
         print(f"\nTotal games: {total_games}")
         
         # Check sample games with their game_type
@@ -55,13 +52,16 @@ def analyze_game_type_data():
         print(f"\nChecking JSON data extraction...")
         
         # Look at a sample JSON file to see if game_type is available
-        import json
-        import glob
+        from pathlib import Path
+        from src.utils.json_handler import read_json_file
         
-        json_files = glob.glob("data/json/2025/04-April/combined_data_*.json")
-        if json_files:
-            with open(json_files[0], 'r') as f:
-                sample_data = json.load(f)
+        # Stop at the first matching file instead of expanding the whole listing
+        sample_dir = Path("data/json/2025/04-April")
+        sample_file = next((p for p in sample_dir.iterdir()
+                            if p.name.startswith('combined_data_') and p.suffix == '.json'),
+                           None) if sample_dir.is_dir() else None
+        if sample_file:
+            sample_data = read_json_file(sample_file)
             
             game_data = sample_data.get('game_data', {})
             if 'gameType' in game_data:
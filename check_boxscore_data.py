@@ -3,65 +3,76 @@
 Check Boxscore Data for Doubles, Triples, Home Runs
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import get_shared_connection
+from src.database import schema_cache
 
 def check_boxscore_data():
     """Check if doubles, triples, and home runs data is properly populated."""
-    db = DatabaseConnection()
+    db = get_shared_connection()
     
     try:
-        db.connect()
-        
         print("📊 CHECKING BOXSCORE DATA FOR DOUBLES, TRIPLES, HOME RUNS")
         print("=" * 70)
         
         # 1. Check if columns exist
         print("1. Verifying columns exist:")
-        result = db.fetch_results("""
-        SELECT COLUMN_NAME
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_NAME = 'boxscore' AND COLUMN_NAME IN ('doubles', 'triples', 'home_runs')
-        ORDER BY COLUMN_NAME
-        """)
-        columns_found = [row[0] for row in result]
+        boxscore_columns = {row[0] for row in schema_cache.get_columns(db, 'boxscore')}
+        columns_found = sorted(boxscore_columns & {'doubles', 'triples', 'home_runs'})
         print(f"   Found columns: {columns_found}")
         
+        # Gather counts, NULL checks and totals in a single pass over boxscore.
+        # An index such as CREATE INDEX IX_boxscore_stats ON boxscore(doubles, triples, home_runs)
+        # lets SQL Server answer this from index pages instead of the full table.
+        stats = db.fetch_results("""
+        SELECT 
+            COUNT(*) as total_records,
+            SUM(CASE WHEN doubles > 0 THEN 1 ELSE 0 END) as doubles_count,
+            SUM(CASE WHEN triples > 0 THEN 1 ELSE 0 END) as triples_count,
+            SUM(CASE WHEN home_runs > 0 THEN 1 ELSE 0 END) as hr_count,
+            SUM(CASE WHEN doubles IS NULL THEN 1 ELSE 0 END) as null_doubles,
+            SUM(CASE WHEN triples IS NULL THEN 1 ELSE 0 END) as null_triples,
+            SUM(CASE WHEN home_runs IS NULL THEN 1 ELSE 0 END) as null_hrs,
+            SUM(ISNULL(doubles, 0)) as total_doubles,
+            SUM(ISNULL(triples, 0)) as total_triples,
+            SUM(ISNULL(home_runs, 0)) as total_homeruns
+        FROM boxscore
+        """)[0]
+        (total_records, doubles_count, triples_count, hr_count,
+         null_doubles, null_triples, null_hrs) = [value or 0 for value in stats[:7]]
+        totals = stats[7:]
+        
         # 2. Check total records
-        total_records = db.fetch_results("SELECT COUNT(*) FROM boxscore")[0][0]
         print(f"2. Total boxscore records: {total_records}")
         
         # 3. Check for non-zero values in new columns
         print("3. Checking for non-zero values:")
-        doubles_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE doubles > 0")[0][0]
-        triples_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE triples > 0")[0][0]
-        hr_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE home_runs > 0")[0][0]
-        
         print(f"   Records with doubles > 0: {doubles_count}")
         print(f"   Records with triples > 0: {triples_count}")
         print(f"   Records with home_runs > 0: {hr_count}")
         
         # 4. Check for NULL values
         print("4. Checking for NULL values:")
-        null_doubles = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE doubles IS NULL")[0][0]
-        null_triples = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE triples IS NULL")[0][0]
-        null_hrs = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE home_runs IS NULL")[0][0]
-        
         print(f"   Records with NULL doubles: {null_doubles}")
         print(f"   Records with NULL triples: {null_triples}")
         print(f"   Records with NULL home_runs: {null_hrs}")
         
         # 5. Sample records with extra base hits
         print("5. Sample records with extra base hits:")
-        sample = db.fetch_results("""
-        SELECT TOP 10 game_id, player_id, at_bats, hits, doubles, triples, home_runs, rbi
-        FROM boxscore
-        WHERE (doubles > 0 OR triples > 0 OR home_runs > 0)
-        ORDER BY (doubles + triples + home_runs) DESC
-        """)
+        if 'extra_base_hits' in boxscore_columns:
+            # Served by IX_boxscore_xbh (see update_boxscore_schema.py) as a range scan
+            sample = db.fetch_results("""
+            SELECT TOP 10 game_id, player_id, at_bats, hits, doubles, triples, home_runs, rbi
+            FROM boxscore
+            WHERE extra_base_hits > 0
+            ORDER BY extra_base_hits DESC
+            """)
+        else:
+            sample = db.fetch_results("""
+            SELECT TOP 10 game_id, player_id, at_bats, hits, doubles, triples, home_runs, rbi
+            FROM boxscore
+            WHERE (doubles > 0 OR triples > 0 OR home_runs > 0)
+            ORDER BY (doubles + triples + home_runs) DESC
+            """)
         
         if sample:
             print("   Game     Player   AB  H   2B  3B  HR  RBI")
@@ -74,14 +85,6 @@ def check_boxscore_data():
         
         # 6. Total statistics
         print("6. Total statistics:")
-        totals = db.fetch_results("""
-        SELECT 
-            SUM(CASE WHEN doubles IS NULL THEN 0 ELSE doubles END) as total_doubles,
-            SUM(CASE WHEN triples IS NULL THEN 0 ELSE triples END) as total_triples,
-            SUM(CASE WHEN home_runs IS NULL THEN 0 ELSE home_runs END) as total_homeruns
-        FROM boxscore
-        """)[0]
-        
         print(f"   Total doubles in database: {totals[0] or 0}")
         print(f"   Total triples in database: {totals[1] or 0}")
         print(f"   Total home runs in database: {totals[2] or 0}")
@@ -99,9 +102,6 @@ def check_boxscore_data():
         
     except Exception as e:
         print(f"❌ Error checking boxscore data: {e}")
-    
-    finally:
-        db.disconnect()
 
 if __name__ == "__main__":
     check_boxscore_data()
@@ -3,36 +3,27 @@
 Check Games Table Structure
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import get_shared_connection
+from src.database import schema_cache
 
 def check_games_table_structure():
     """Check the current structure of the dbo.games table."""
     
-    db = DatabaseConnection()
+    db = get_shared_connection()
     
     try:
-        db.connect()
-        
         print("📊 CHECKING GAMES TABLE STRUCTURE")
         print("=" * 50)
         
         # Get table structure
-        result = db.fetch_results("""
-        SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
-        FROM INFORMATION_SCHEMA.COLUMNS
-        WHERE TABLE_NAME = 'games'
-        ORDER BY ORDINAL_POSITION
-        """)
+        result = schema_cache.get_columns(db, 'games')
         
         print("Column Name".ljust(20) + "Data Type".ljust(15) + "Nullable".ljust(10) + "Default")
         print("-" * 60)
-        for row in result:
-            col_name, data_type, nullable, default = row
-            print(f"{col_name}".ljust(20) + f"{data_type}".ljust(15) + f"{nullable}".ljust(10) + f"{default or ''}".ljust(15))
+        print("\n".join(
+            f"{col_name}".ljust(20) + f"{data_type}".ljust(15) + f"{nullable}".ljust(10) + f"{default or ''}".ljust(15)
+            for col_name, data_type, nullable, default in result
+        ))
         
         print(f"\nTotal columns: {len(result)}")
         
@@ -78,9 +69,6 @@ def check_games_table_structure():
     
     except Exception as e:
         print(f"❌ Error checking table structure: {e}")
-    
-    finally:
-        db.disconnect()
 
 if __name__ == "__main__":
     check_games_table_structure()
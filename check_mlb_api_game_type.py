@@ -5,6 +5,54 @@ Check MLB API for Game Type Information
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+# Reuse one keep-alive connection for every request made by this script
+session = requests.Session()
+session.headers.update({'Accept-Encoding': 'gzip', 'User-Agent': 'mlb-pipeline/1.0'})
+session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1,
+                                      max_retries=Retry(total=3, backoff_factor=0.3)))
+
+def read_feed_summary(response):
+    """
+    Read only what the check needs from a game feed response.
+    
+    With ijson available the feed is streamed and only the gameData.game
+    subtree is materialized; otherwise the whole document is parsed.
+    
+    Returns:
+        Tuple of (top-level keys, gameData keys or None, gameData.game dict or None)
+    """
+    if ijson is None:
+        feed_data = response.json()
+        game_data = feed_data.get('gameData')
+        return (list(feed_data.keys()),
+                list(game_data.keys()) if game_data is not None else None,
+                game_data.get('game') if game_data is not None else None)
+    
+    response.raw.decode_content = True
+    top_keys, game_data_keys, builder = [], None, None
+    for prefix, event, value in ijson.parse(response.raw):
+        if event == 'map_key' and prefix == '':
+            top_keys.append(value)
+        elif prefix == 'gameData' and event == 'start_map':
+            game_data_keys = []
+        elif prefix == 'gameData' and event == 'map_key':
+            game_data_keys.append(value)
+        elif prefix == 'gameData.game' and event == 'start_map':
+            builder = ObjectBuilder()
+        
+        if builder is not None and (prefix == 'gameData.game' or prefix.startswith('gameData.game.')):
+            builder.event(event, value)
+    
+    return top_keys, game_data_keys, builder.value if builder is not None else None
 
 def check_mlb_api_game_type():
     """Check if MLB API provides game type information."""
@@ -26,7 +74,7 @@ def check_mlb_api_game_type():
     }
     
     try:
-        response = requests.get(schedule_url, params=params)
+        response = session.get(schedule_url, params=params)
         if response.status_code == 200:
             schedule_data = response.json()
             
@@ -58,21 +106,25 @@ def check_mlb_api_game_type():
             game_id = games[0]['gamePk']
             feed_url = f"{base_url}/game/{game_id}/feed/live"
             
-            response = requests.get(feed_url)
+            # Ask the API to serialize only the gameData.game subtree instead of
+            # the full multi-MB live feed
+            feed_params = {
+                'fields': 'gameData,game,pk,type,doubleHeader,id,gamedayType,'
+                          'tiebreaker,gameNumber,season,seasonDisplay'
+            }
+            response = session.get(feed_url, params=feed_params, stream=True)
             if response.status_code == 200:
-                feed_data = response.json()
+                top_keys, game_data_keys, game_info = read_feed_summary(response)
                 
                 # Check top level
-                print(f"   Feed top-level keys: {list(feed_data.keys())}")
+                print(f"   Feed top-level keys: {top_keys}")
                 
                 # Check gameData section
-                if 'gameData' in feed_data:
-                    game_data = feed_data['gameData']
-                    print(f"   GameData keys: {list(game_data.keys())}")
+                if game_data_keys is not None:
+                    print(f"   GameData keys: {game_data_keys}")
                     
                     # Check game section
-                    if 'game' in game_data:
-                        game_info = game_data['game']
+                    if game_info is not None:
                         print(f"   Game info keys: {list(game_info.keys())}")
                         
                         if 'type' in game_info:
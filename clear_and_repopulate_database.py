@@ -4,17 +4,42 @@ Clear and Repopulate Database with March and April 2025 Data
 """
 
 import os
-import sys
-import glob
-from pathlib import Path
+import re
+import argparse
 
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+from src.database.connection import DatabaseConnection
+from src.database.json_to_sql_loader import JSONToSQLLoader, load_files_parallel
+from src.utils.json_handler import find_combined_files
 
-from database.connection import DatabaseConnection
-from database.json_to_sql_loader import JSONToSQLLoader
+# game_id embedded in combined_data_{game_id}_{date}.json file names
+_GAME_ID_RE = re.compile(r"combined_data_(\d+)_")
 
-def clear_and_repopulate_database():
-    """Clear database tables and repopulate with March and April 2025 data."""
+def get_table_counts(db):
+    """Return (games, boxscore, players, teams) row counts in one round-trip."""
+    return db.fetch_scalars([
+        "SELECT COUNT(*) FROM games",
+        "SELECT COUNT(*) FROM boxscore",
+        "SELECT COUNT(*) FROM players",
+        "SELECT COUNT(*) FROM teams",
+    ])
+
+def filter_unloaded_files(file_paths, loaded_ids):
+    """Drop combined data files whose game_id is already in loaded_ids."""
+    unloaded = []
+    for file_path in file_paths:
+        match = _GAME_ID_RE.search(os.path.basename(file_path))
+        if not match or int(match.group(1)) not in loaded_ids:
+            unloaded.append(file_path)
+    return unloaded
+
+def clear_and_repopulate_database(resume=False):
+    """
+    Clear database tables and repopulate with March and April 2025 data.
+    
+    Args:
+        resume: Keep the existing data and only load files whose game is not
+            in the database yet (for reruns after a partial failure)
+    """
     
     print("🚀 CLEARING AND REPOPULATING DATABASE")
     print("=" * 60)
@@ -25,131 +50,101 @@ def clear_and_repopulate_database():
     try:
         db.connect()
         
-        # 1. Clear all tables
-        print("1. Clearing all database tables...")
-        
-        # Get counts before deletion
-        games_before = db.fetch_results("SELECT COUNT(*) FROM games")[0][0]
-        boxscore_before = db.fetch_results("SELECT COUNT(*) FROM boxscore")[0][0]
-        players_before = db.fetch_results("SELECT COUNT(*) FROM players")[0][0]
-        teams_before = db.fetch_results("SELECT COUNT(*) FROM teams")[0][0]
-        
-        print(f"   Records before deletion:")
-        print(f"     Games: {games_before}")
-        print(f"     Boxscore: {boxscore_before}")
-        print(f"     Players: {players_before}")
-        print(f"     Teams: {teams_before}")
-        
-        # Clear tables in proper order (respecting foreign keys)
-        print("   Clearing boxscore table...")
-        db.execute_query("DELETE FROM boxscore")
-        
-        print("   Clearing games table...")
-        db.execute_query("DELETE FROM games")
-        
-        print("   Clearing players table...")
-        db.execute_query("DELETE FROM players")
-        
-        print("   Clearing teams table...")
-        db.execute_query("DELETE FROM teams")
+        if resume:
+            print("1. Resuming: keeping existing data and skipping games already loaded")
+        else:
+            # 1. Clear all tables
+            print("1. Clearing all database tables...")
+        
+            # Get counts before deletion
+            games_before, boxscore_before, players_before, teams_before = get_table_counts(db)
+        
+            print(f"   Records before deletion:")
+            print(f"     Games: {games_before}")
+            print(f"     Boxscore: {boxscore_before}")
+            print(f"     Players: {players_before}")
+            print(f"     Teams: {teams_before}")
+        
+            # Clear tables in proper order (respecting foreign keys). TRUNCATE is
+            # minimally logged, but SQL Server refuses it on tables referenced by a
+            # foreign key (even a disabled one), so those still use DELETE.
+            referenced_tables = {row[0] for row in db.fetch_results(
+                "SELECT DISTINCT OBJECT_NAME(referenced_object_id) FROM sys.foreign_keys"
+            )}
+            clear_queries = []
+            for table in ['boxscore', 'games', 'players', 'teams']:
+                print(f"   Clearing {table} table...")
+                if table in referenced_tables:
+                    clear_queries.append(f"DELETE FROM {table}")
+                else:
+                    clear_queries.append(f"TRUNCATE TABLE {table}")
+            
+            # One committed transaction, so the worker processes loading next
+            # do not block on locks still held by this connection
+            db.execute_transaction(clear_queries)
         
-        # Verify tables are empty
-        games_after = db.fetch_results("SELECT COUNT(*) FROM games")[0][0]
-        boxscore_after = db.fetch_results("SELECT COUNT(*) FROM boxscore")[0][0]
-        players_after = db.fetch_results("SELECT COUNT(*) FROM players")[0][0]
-        teams_after = db.fetch_results("SELECT COUNT(*) FROM teams")[0][0]
+            # Verify tables are empty
+            games_after, boxscore_after, players_after, teams_after = get_table_counts(db)
         
-        print(f"   ✅ Tables cleared successfully!")
-        print(f"     Games: {games_after}")
-        print(f"     Boxscore: {boxscore_after}")
-        print(f"     Players: {players_after}")
-        print(f"     Teams: {teams_after}")
+            print(f"   ✅ Tables cleared successfully!")
+            print(f"     Games: {games_after}")
+            print(f"     Boxscore: {boxscore_after}")
+            print(f"     Players: {players_after}")
+            print(f"     Teams: {teams_after}")
         
         # 2. Find all March and April combined data files
         print("\n2. Finding March and April data files...")
         
-        march_data_path = Path("data/json/2025/03-March")
-        april_data_path = Path("data/json/2025/04-April")
-        
-        march_files = list(march_data_path.glob("combined_data_*.json")) if march_data_path.exists() else []
-        april_files = list(april_data_path.glob("combined_data_*.json")) if april_data_path.exists() else []
-        
-        march_files.sort()
-        april_files.sort()
+        march_files = find_combined_files("data/json/2025/03-March")
+        april_files = find_combined_files("data/json/2025/04-April")
         
         print(f"   Found {len(march_files)} March files")
         print(f"   Found {len(april_files)} April files")
-        print(f"   Total files to process: {len(march_files) + len(april_files)}")
+        total_files = len(march_files) + len(april_files)
+        print(f"   Total files to process: {total_files}")
         
         if not march_files and not april_files:
             print("❌ No data files found! Make sure data extraction was completed.")
             return
         
-        # 3. Initialize JSON loader with enhanced schema
+        if resume:
+            # Reruns after a partial failure only load games that are not in the database yet
+            loaded_ids = {row[0] for row in db.fetch_results("SELECT game_id FROM games")}
+            march_files = filter_unloaded_files(march_files, loaded_ids)
+            april_files = filter_unloaded_files(april_files, loaded_ids)
+            print(f"   Skipping {total_files - len(march_files) - len(april_files)} already-loaded files")
+        
+        # 3. Initialize JSON loader with enhanced schema (used for serial retries)
         loader = JSONToSQLLoader()
         
+        # Files are independent, so load them across a pool of worker processes
         # 4. Load March data
         if march_files:
             print(f"\n3. Loading {len(march_files)} March files...")
             
-            march_success = 0
-            march_errors = 0
-            
-            for i, file_path in enumerate(march_files, 1):
-                try:
-                    if i % 50 == 0 or i % 100 == 1:  # Progress update
-                        print(f"   [{i}/{len(march_files)}] Loading {file_path.name}...")
-                    
-                    # Load the combined data file
-                    success = loader.load_json_to_database(str(file_path))
-                    if success:
-                        march_success += 1
-                    else:
-                        march_errors += 1
-                    
-                except Exception as e:
-                    print(f"   ❌ Error loading {file_path.name}: {e}")
-                    march_errors += 1
+            march_loaded, march_failed = load_files_parallel(
+                march_files, workers=os.cpu_count(), loader=loader)
             
             print(f"   March loading completed!")
-            print(f"     ✅ Successfully loaded: {march_success} files")
-            print(f"     ❌ Errors: {march_errors} files")
+            print(f"     ✅ Successfully loaded: {len(march_loaded)} files")
+            print(f"     ❌ Errors: {len(march_failed)} files")
         
         # 5. Load April data
         if april_files:
             print(f"\n4. Loading {len(april_files)} April files...")
             
-            april_success = 0
-            april_errors = 0
-            
-            for i, file_path in enumerate(april_files, 1):
-                try:
-                    if i % 50 == 0 or i % 100 == 1:  # Progress update
-                        print(f"   [{i}/{len(april_files)}] Loading {file_path.name}...")
-                    
-                    # Load the combined data file
-                    success = loader.load_json_to_database(str(file_path))
-                    if success:
-                        april_success += 1
-                    else:
-                        april_errors += 1
-                    
-                except Exception as e:
-                    print(f"   ❌ Error loading {file_path.name}: {e}")
-                    april_errors += 1
+            april_loaded, april_failed = load_files_parallel(
+                april_files, workers=os.cpu_count(), loader=loader)
             
             print(f"   April loading completed!")
-            print(f"     ✅ Successfully loaded: {april_success} files")
-            print(f"     ❌ Errors: {april_errors} files")
+            print(f"     ✅ Successfully loaded: {len(april_loaded)} files")
+            print(f"     ❌ Errors: {len(april_failed)} files")
         
         # 6. Verify the loaded data
         print(f"\n5. Verifying loaded data...")
         
         # Check final counts
-        final_games = db.fetch_results("SELECT COUNT(*) FROM games")[0][0]
-        final_boxscore = db.fetch_results("SELECT COUNT(*) FROM boxscore")[0][0]
-        final_players = db.fetch_results("SELECT COUNT(*) FROM players")[0][0]
-        final_teams = db.fetch_results("SELECT COUNT(*) FROM teams")[0][0]
+        final_games, final_boxscore, final_players, final_teams = get_table_counts(db)
         
         print(f"   Final record counts:")
         print(f"     Games: {final_games}")
@@ -223,4 +218,12 @@ def clear_and_repopulate_database():
         db.disconnect()
 
 if __name__ == "__main__":
-    clear_and_repopulate_database()
+    parser = argparse.ArgumentParser(description="Clear and repopulate the database with March and April 2025 data")
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Keep existing data and only load games that are not in the database yet'
+    )
+    args = parser.parse_args()
+    
+    clear_and_repopulate_database(resume=args.resume)
@@ -5,11 +5,7 @@ This script creates a comprehensive date dimension table with useful attributes.
 """
 
 import sys
-from pathlib import Path
-from datetime import datetime, date, timedelta
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
+from datetime import date
 
 from src.database.connection import DatabaseConnection
 
@@ -96,6 +92,87 @@ def create_date_dimension_table():
     finally:
         db.disconnect()
 
+DIM_DATE_COLUMNS = [
+    'date_key', 'full_date', 'year', 'quarter', 'month', 'week_of_year', 'day_of_year', 'day_of_month', 'day_of_week',
+    'year_text', 'quarter_text', 'month_name', 'month_name_short', 'month_year', 'day_name', 'day_name_short',
+    'is_weekend', 'is_weekday', 'is_month_start', 'is_month_end', 'is_quarter_start', 'is_quarter_end', 'is_year_start', 'is_year_end',
+    'mlb_season_year', 'is_mlb_regular_season', 'is_mlb_spring_training', 'is_mlb_playoffs', 'is_mlb_offseason', 'mlb_season_phase',
+    'days_from_today', 'is_past', 'is_future', 'is_today'
+]
+
+# Generates every date between :start_date and :end_date server-side and
+# derives all attributes in T-SQL, so the whole dimension is one statement.
+# day_of_week and the names are computed without DATEFIRST/DATENAME so the
+# result does not depend on the session's language settings.
+POPULATE_DIM_DATE_SQL = f"""
+WITH dates AS (
+    SELECT CAST(:start_date AS DATE) AS full_date
+    UNION ALL
+    SELECT DATEADD(day, 1, full_date) FROM dates WHERE full_date < :end_date
+),
+parts AS (
+    SELECT full_date,
+           YEAR(full_date) AS yr,
+           MONTH(full_date) AS mo,
+           DAY(full_date) AS dom,
+           DATEDIFF(day, '19000107', full_date) % 7 + 1 AS dow,  -- 1900-01-07 was a Sunday
+           DATEDIFF(day, :today, full_date) AS days_from_today
+    FROM dates
+),
+named AS (
+    SELECT p.*,
+           CHOOSE(mo, 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+                  'August', 'September', 'October', 'November', 'December') AS month_name,
+           CHOOSE(dow, 'Sunday', 'Monday', 'Tuesday', 'Wednesday',
+                  'Thursday', 'Friday', 'Saturday') AS day_name,
+           -- MLB season phases (approximate)
+           CASE
+               WHEN mo = 2 OR (mo = 3 AND dom < 20) THEN 'Spring Training'
+               WHEN mo BETWEEN 3 AND 9 THEN 'Regular Season'
+               WHEN mo = 10 OR (mo = 11 AND dom < 15) THEN 'Playoffs'
+               ELSE 'Offseason'
+           END AS mlb_season_phase
+    FROM parts p
+)
+INSERT INTO dim_date WITH (TABLOCK) ({', '.join(DIM_DATE_COLUMNS)})
+SELECT yr * 10000 + mo * 100 + dom,
+       full_date,
+       yr,
+       DATEPART(quarter, full_date),
+       mo,
+       DATEPART(iso_week, full_date),
+       DATEPART(dayofyear, full_date),
+       dom,
+       dow,
+       CAST(yr AS NVARCHAR(4)),
+       CONCAT('Q', DATEPART(quarter, full_date), ' ', yr),
+       month_name,
+       LEFT(month_name, 3),
+       CONCAT(month_name, ' ', yr),
+       day_name,
+       LEFT(day_name, 3),
+       CASE WHEN dow IN (1, 7) THEN 1 ELSE 0 END,
+       CASE WHEN dow IN (1, 7) THEN 0 ELSE 1 END,
+       CASE WHEN dom = 1 THEN 1 ELSE 0 END,
+       CASE WHEN full_date = EOMONTH(full_date) THEN 1 ELSE 0 END,
+       CASE WHEN dom = 1 AND mo IN (1, 4, 7, 10) THEN 1 ELSE 0 END,
+       CASE WHEN full_date = EOMONTH(full_date) AND mo IN (3, 6, 9, 12) THEN 1 ELSE 0 END,
+       CASE WHEN mo = 1 AND dom = 1 THEN 1 ELSE 0 END,
+       CASE WHEN mo = 12 AND dom = 31 THEN 1 ELSE 0 END,
+       yr + CASE WHEN mo >= 10 THEN 1 ELSE 0 END,  -- October onwards is next season
+       CASE WHEN mlb_season_phase = 'Regular Season' THEN 1 ELSE 0 END,
+       CASE WHEN mlb_season_phase = 'Spring Training' THEN 1 ELSE 0 END,
+       CASE WHEN mlb_season_phase = 'Playoffs' THEN 1 ELSE 0 END,
+       CASE WHEN mlb_season_phase = 'Offseason' THEN 1 ELSE 0 END,
+       mlb_season_phase,
+       days_from_today,
+       CASE WHEN days_from_today < 0 THEN 1 ELSE 0 END,
+       CASE WHEN days_from_today > 0 THEN 1 ELSE 0 END,
+       CASE WHEN days_from_today = 0 THEN 1 ELSE 0 END
+FROM named
+OPTION (MAXRECURSION 0)
+"""
+
 def populate_date_dimension(start_year=2020, end_year=2030):
     """Populate the date dimension table with data."""
     
@@ -105,110 +182,17 @@ def populate_date_dimension(start_year=2020, end_year=2030):
         
         print(f"2. Populating date dimension from {start_year} to {end_year}...")
         
-        # Generate dates
         start_date = date(start_year, 1, 1)
         end_date = date(end_year, 12, 31)
-        current_date = start_date
-        today = date.today()
-        
-        batch_size = 100
-        batch_data = []
-        total_inserted = 0
-        
-        while current_date <= end_date:
-            # Calculate date attributes
-            date_key = int(current_date.strftime('%Y%m%d'))
-            year = current_date.year
-            quarter = ((current_date.month - 1) // 3) + 1
-            month = current_date.month
-            day_of_month = current_date.day
-            day_of_year = current_date.timetuple().tm_yday
-            week_of_year = current_date.isocalendar()[1]
-            day_of_week = current_date.isoweekday() % 7 + 1  # Convert to 1=Sunday format
-            
-            # Text descriptions
-            month_names = ['', 'January', 'February', 'March', 'April', 'May', 'June',
-                          'July', 'August', 'September', 'October', 'November', 'December']
-            month_names_short = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            day_names = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
-            day_names_short = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
-            
-            month_name = month_names[month]
-            month_name_short = month_names_short[month]
-            day_name = day_names[(day_of_week - 1) % 7]
-            day_name_short = day_names_short[(day_of_week - 1) % 7]
-            
-            # Business attributes
-            is_weekend = 1 if day_of_week in [1, 7] else 0  # Sunday=1, Saturday=7
-            is_weekday = 1 - is_weekend
-            
-            # Month/quarter/year boundaries
-            is_month_start = 1 if day_of_month == 1 else 0
-            is_month_end = 1 if (current_date + timedelta(days=1)).day == 1 else 0
-            is_quarter_start = 1 if month in [1, 4, 7, 10] and day_of_month == 1 else 0
-            is_quarter_end = 1 if month in [3, 6, 9, 12] and is_month_end == 1 else 0
-            is_year_start = 1 if month == 1 and day_of_month == 1 else 0
-            is_year_end = 1 if month == 12 and day_of_month == 31 else 0
-            
-            # MLB season logic (approximate dates)
-            mlb_season_year = year
-            if month >= 10:  # October onwards is next season
-                mlb_season_year = year + 1
-                
-            # MLB season phases (approximate)
-            is_mlb_spring_training = 0
-            is_mlb_regular_season = 0
-            is_mlb_playoffs = 0
-            is_mlb_offseason = 0
-            mlb_season_phase = 'Offseason'
-            
-            if month == 2 or (month == 3 and day_of_month < 20):  # Feb - mid March
-                is_mlb_spring_training = 1
-                mlb_season_phase = 'Spring Training'
-            elif (month == 3 and day_of_month >= 20) or month in [4, 5, 6, 7, 8, 9]:  # Mid March - September
-                is_mlb_regular_season = 1
-                mlb_season_phase = 'Regular Season'
-            elif month == 10 or (month == 11 and day_of_month < 15):  # October - mid November
-                is_mlb_playoffs = 1
-                mlb_season_phase = 'Playoffs'
-            else:
-                is_mlb_offseason = 1
-                mlb_season_phase = 'Offseason'
-            
-            # Relative to today
-            days_from_today = (current_date - today).days
-            is_past = 1 if current_date < today else 0
-            is_future = 1 if current_date > today else 0
-            is_today = 1 if current_date == today else 0
-            
-            # Prepare batch insert
-            batch_data.append((
-                date_key, current_date, year, quarter, month, week_of_year, day_of_year, day_of_month, day_of_week,
-                str(year), f'Q{quarter} {year}', month_name, month_name_short, f'{month_name} {year}',
-                day_name, day_name_short,
-                is_weekend, is_weekday, is_month_start, is_month_end, is_quarter_start, is_quarter_end,
-                is_year_start, is_year_end,
-                mlb_season_year, is_mlb_regular_season, is_mlb_spring_training, is_mlb_playoffs, is_mlb_offseason, mlb_season_phase,
-                days_from_today, is_past, is_future, is_today
-            ))
-            
-            # Insert batch when full
-            if len(batch_data) >= batch_size:
-                insert_batch(db, batch_data)
-                total_inserted += len(batch_data)
-                if total_inserted % 1000 == 0:
-                    print(f"   📅 Inserted {total_inserted} dates...")
-                batch_data = []
-            
-            current_date += timedelta(days=1)
         
-        # Insert remaining batch
-        if batch_data:
-            insert_batch(db, batch_data)
-            total_inserted += len(batch_data)
+        # Generate and insert every date on the server in a single INSERT ... SELECT
+        db.execute_transaction([(POPULATE_DIM_DATE_SQL, {
+            'start_date': start_date,
+            'end_date': end_date,
+            'today': date.today(),
+        })])
         
-        print(f"   ✅ Successfully inserted {total_inserted} dates")
+        print(f"   ✅ Successfully inserted {(end_date - start_date).days + 1} dates")
         return True
         
     except Exception as e:
@@ -219,27 +203,6 @@ def populate_date_dimension(start_year=2020, end_year=2030):
     finally:
         db.disconnect()
 
-def insert_batch(db, batch_data):
-    """Insert a batch of date records."""
-    
-    insert_sql = """
-    INSERT INTO dim_date (
-        date_key, full_date, year, quarter, month, week_of_year, day_of_year, day_of_month, day_of_week,
-        year_text, quarter_text, month_name, month_name_short, month_year, day_name, day_name_short,
-        is_weekend, is_weekday, is_month_start, is_month_end, is_quarter_start, is_quarter_end, is_year_start, is_year_end,
-        mlb_season_year, is_mlb_regular_season, is_mlb_spring_training, is_mlb_playoffs, is_mlb_offseason, mlb_season_phase,
-        days_from_today, is_past, is_future, is_today
-    ) VALUES """
-    
-    # Build values clause
-    values_list = []
-    for data in batch_data:
-        values = "(" + ", ".join([f"'{item}'" if isinstance(item, str) or isinstance(item, date) else str(item) for item in data]) + ")"
-        values_list.append(values)
-    
-    full_sql = insert_sql + ", ".join(values_list)
-    db.execute_query(full_sql)
-
 def verify_date_dimension():
     """Verify the date dimension table was created and populated correctly."""
     
@@ -3,12 +3,9 @@
 Debug Boxscore Loading Issue
 """
 
-import sys
-import json
-sys.path.append('src')
-
-from database.connection import DatabaseConnection
-from database.json_to_sql_loader import JSONToSQLLoader
+from src.database.connection import DatabaseConnection
+from src.database.json_to_sql_loader import JSONToSQLLoader
+from src.utils.json_handler import read_json_file
 
 def debug_boxscore_loading():
     """Debug why boxscore data isn't being loaded."""
@@ -20,8 +17,7 @@ def debug_boxscore_loading():
     json_file = 'data/json/2025/05-May/combined_data_777691_20250531.json'
     print(f"Loading file: {json_file}")
     
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    data = read_json_file(json_file)
     
     print(f"✅ JSON loaded successfully")
     print(f"Game ID: {data.get('game_id')}")
@@ -74,9 +70,13 @@ def debug_boxscore_loading():
     if db.connect():
         print("✅ Connected to database")
         
+        # Same statement text and params before and after the load, so the
+        # driver can reuse the prepared statement and cached plan
+        count_query = "SELECT COUNT(*) FROM boxscore WHERE game_id = :game_id"
+        count_params = {'game_id': data.get('game_id')}
+        
         # Check before loading
-        before_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE game_id = :game_id", 
-                                      {'game_id': data.get('game_id')})[0][0]
+        before_count = db.fetch_results(count_query, count_params)[0][0]
         print(f"Boxscore records before loading: {before_count}")
         
         # Try loading
@@ -90,8 +90,7 @@ def debug_boxscore_loading():
             traceback.print_exc()
         
         # Check after loading
-        after_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE game_id = :game_id", 
-                                     {'game_id': data.get('game_id')})[0][0]
+        after_count = db.fetch_results(count_query, count_params)[0][0]
         print(f"Boxscore records after loading: {after_count}")
         
         if after_count > before_count:
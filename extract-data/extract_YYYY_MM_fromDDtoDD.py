@@ -5,6 +5,7 @@ This script will extract detailed game and boxscore data for any custom date ran
 """
 
 import sys
+import calendar
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -35,31 +36,22 @@ def extract_mlb_data():
             print("❌ Invalid month. Please enter a month between 1 and 12.")
             return False
             
-        if begin_day < 1 or begin_day > 31 or end_day < 1 or end_day > 31:
-            print("❌ Invalid day range. Days must be between 1 and 31.")
+        # Validate both days exist in the chosen month
+        days_in_month = calendar.monthrange(year, month)[1]
+        if not (1 <= begin_day <= days_in_month and 1 <= end_day <= days_in_month):
+            print(f"❌ Invalid day range. Days must be between 1 and {days_in_month}.")
             return False
             
         if begin_day > end_day:
             print("❌ Beginning day cannot be greater than ending day.")
             return False
             
-        # Validate date exists (basic check for month-day combinations)
-        from datetime import datetime
-        try:
-            datetime(year, month, begin_day)
-            datetime(year, month, end_day)
-        except ValueError as ve:
-            print(f"❌ Invalid date: {ve}")
-            return False
-            
         # Format dates
         start_date = f"{year}-{month:02d}-{begin_day:02d}"
         end_date = f"{year}-{month:02d}-{end_day:02d}"
         
         # Get month name for display
-        month_names = ["", "January", "February", "March", "April", "May", "June",
-                      "July", "August", "September", "October", "November", "December"]
-        month_name = month_names[month]
+        month_name = calendar.month_name[month]
         
         print(f"🗓️  Extracting detailed game and boxscore data for {month_name} {begin_day:02d}-{end_day:02d}, {year}")
         print("📅 This will include player statistics, boxscores, and game details")
@@ -8,8 +8,8 @@ import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
+# Add the project root (which holds the src package) to the path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from src.etl.extract import extract_season_data
 
@@ -65,11 +65,5 @@ if __name__ == "__main__":
         print(f"💡 Next step: Run 'python load_june_data.py' to load the data into the database")
     else:
         print(f"\n❌ June 2025 extraction failed!")
-
-if __name__ == "__main__":
-    success = extract_june_2025()
-    if success:
-        print(f"\n✅ June 2025 extraction completed successfully!")
-        print(f"💡 Next step: Run 'python load_june_data.py' to load the data into the database")
-    else:
-        print(f"\n❌ June 2025 extraction failed!")
+    
+    sys.exit(0 if success else 1)
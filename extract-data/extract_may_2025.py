@@ -4,12 +4,13 @@ Extract May 2025 MLB Data
 This script will extract detailed game and boxscore data for May 2025.
 """
 
+import os
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
+# Add the project root (which holds the src package) to the path
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from src.etl.extract import extract_season_data
 
@@ -50,8 +51,10 @@ def extract_may_2025():
             # Check what was extracted
             may_data_path = Path("data/json/2025/05-May")
             if may_data_path.exists():
-                combined_files = list(may_data_path.glob("combined_data_*.json"))
-                print(f"📊 Extracted {len(combined_files)} combined data files")
+                with os.scandir(may_data_path) as entries:
+                    combined_count = sum(1 for entry in entries
+                                         if entry.name.startswith("combined_data_") and entry.name.endswith(".json"))
+                print(f"📊 Extracted {combined_count} combined data files")
             
             return True
         else:
@@ -10,17 +10,18 @@ from pathlib import Path
 from datetime import datetime, date, timedelta
 
 # Add the project root to the Python path
-project_root = Path(__file__).parent
+project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.etl.extract import extract_season_data, get_games_for_date
+from src.utils.json_handler import write_json_file
 
 def create_parser():
     """Create argument parser for season extraction."""
     parser = argparse.ArgumentParser(description='Extract MLB season data')
     
     # Mode selection
-    parser.add_argument('mode', choices=['season', 'month', 'week', 'date-range', 'test'],
+    parser.add_argument('mode', choices=list(MODE_DISPATCH),
                        help='Extraction mode')
     
     # Year argument
@@ -50,6 +51,8 @@ def create_parser():
                        help='Delay between API calls in seconds (default: 1.0)')
     parser.add_argument('--max-games-per-day', type=int,
                        help='Limit games per day (useful for testing)')
+    parser.add_argument('--concurrency', '-c', type=int, default=1,
+                       help='Number of games fetched concurrently (default: 1)')
     
     # Testing options
     parser.add_argument('--test-days', type=int, default=7,
@@ -65,7 +68,8 @@ def extract_season(args):
         year=args.year,
         save_json=not args.no_json,
         delay_seconds=args.delay,
-        max_games_per_day=args.max_games_per_day
+        max_games_per_day=args.max_games_per_day,
+        concurrency=args.concurrency
     )
     
     return stats
@@ -92,7 +96,8 @@ def extract_month(args):
         end_date=end_date,
         save_json=not args.no_json,
         delay_seconds=args.delay,
-        max_games_per_day=args.max_games_per_day
+        max_games_per_day=args.max_games_per_day,
+        concurrency=args.concurrency
     )
     
     return stats
@@ -114,7 +119,8 @@ def extract_week(args):
             end_date=end_date,
             save_json=not args.no_json,
             delay_seconds=args.delay,
-            max_games_per_day=args.max_games_per_day
+            max_games_per_day=args.max_games_per_day,
+            concurrency=args.concurrency
         )
         
         return stats
@@ -140,7 +146,8 @@ def extract_date_range(args):
             end_date=end_date,
             save_json=not args.no_json,
             delay_seconds=args.delay,
-            max_games_per_day=args.max_games_per_day
+            max_games_per_day=args.max_games_per_day,
+            concurrency=args.concurrency
         )
         
         return stats
@@ -161,11 +168,21 @@ def test_extraction(args):
         end_date=end_date,
         save_json=not args.no_json,
         delay_seconds=args.delay,
-        max_games_per_day=args.max_games_per_day or 2  # Limit for testing
+        max_games_per_day=args.max_games_per_day or 2,  # Limit for testing
+        concurrency=args.concurrency
     )
     
     return stats
 
+# Extraction function for each CLI mode
+MODE_DISPATCH = {
+    'season': extract_season,
+    'month': extract_month,
+    'week': extract_week,
+    'date-range': extract_date_range,
+    'test': test_extraction,
+}
+
 def main():
     """Main function."""
     parser = create_parser()
@@ -175,30 +192,14 @@ def main():
     print("=" * 50)
     
     # Execute based on mode
-    if args.mode == 'season':
-        stats = extract_season(args)
-    elif args.mode == 'month':
-        stats = extract_month(args)
-    elif args.mode == 'week':
-        stats = extract_week(args)
-    elif args.mode == 'date-range':
-        stats = extract_date_range(args)
-    elif args.mode == 'test':
-        stats = test_extraction(args)
-    else:
-        print(f"❌ Unknown mode: {args.mode}")
-        return
+    stats = MODE_DISPATCH[args.mode](args)
     
     if stats:
         # Save extraction report
         report_file = f"extraction_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            import json
-            with open(report_file, 'w') as f:
-                # Convert datetime objects to strings for JSON serialization
-                json_stats = {k: str(v) if isinstance(v, (datetime, date, timedelta)) else v 
-                             for k, v in stats.items()}
-                json.dump(json_stats, f, indent=2)
+            # default=str covers the timedelta duration (and dates without orjson)
+            write_json_file(report_file, stats, default=str)
             print(f"📄 Extraction report saved to: {report_file}")
         except Exception as e:
             print(f"❌ Could not save report: {e}")
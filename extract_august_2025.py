@@ -4,13 +4,8 @@ Extract August 2025 MLB Data (Up to August 15)
 This script will extract detailed game and boxscore data for August 1-15, 2025.
 """
 
-import sys
-from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
-
 from src.etl.extract import extract_season_data
 
 def extract_august_2025():
@@ -5,12 +5,8 @@ This script will extract detailed game and boxscore data for June 2025.
 """
 
 import sys
-from pathlib import Path
 from datetime import datetime, timedelta
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
-
 from src.etl.extract import extract_season_data
 
 def extract_june_2025():
@@ -65,11 +61,5 @@ if __name__ == "__main__":
         print(f"💡 Next step: Run 'python load_june_data.py' to load the data into the database")
     else:
         print(f"\n❌ June 2025 extraction failed!")
-
-if __name__ == "__main__":
-    success = extract_june_2025()
-    if success:
-        print(f"\n✅ June 2025 extraction completed successfully!")
-        print(f"💡 Next step: Run 'python load_june_data.py' to load the data into the database")
-    else:
-        print(f"\n❌ June 2025 extraction failed!")
+    
+    sys.exit(0 if success else 1)
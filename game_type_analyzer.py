@@ -4,11 +4,34 @@ Game Type Analysis Utility
 Provides functions to filter and analyze games by type (regular season vs preseason/spring training).
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+from datetime import date
 
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
+
+# Two fixed statements, one with and one without the game_type filter, rather
+# than a catch-all "(:game_type IS NULL OR ...)" predicate: a single cached
+# plan for the catch-all has to serve both shapes and cannot seek on
+# IX_games_type_date. Every filter is still a bound parameter, so each text is
+# compiled once and its plan reused. The year is a half-open game_date range
+# (not YEAR(game_date)) so it stays sargable. Team names are resolved from
+# GameTypeAnalyzer's cached team map, so the read is served from the index
+# alone without joining teams.
+_GAMES_SELECT = """
+SELECT TOP (:limit) g.game_id, g.game_date, g.official_date, g.game_type, g.series_description,
+       g.game_status, g.home_score, g.away_score, g.home_team_id, g.away_team_id
+FROM games g
+WHERE g.game_date >= :date_from AND g.game_date < :date_to
+"""
+
+GAMES_BY_TYPE_SQL = _GAMES_SELECT + """  AND g.game_type = :game_type
+ORDER BY g.game_date DESC
+"""
+
+ALL_GAMES_SQL = _GAMES_SELECT + """ORDER BY g.game_date DESC
+"""
+
+# TOP value used when no limit is requested (largest SQL Server INT)
+_NO_LIMIT = 2147483647
 
 class GameTypeAnalyzer:
     def __init__(self):
@@ -24,53 +47,79 @@ class GameTypeAnalyzer:
             'W': 'World Series',
             'A': 'All-Star Game'
         }
+        self._connected = False
+        self._team_names = None
+    
+    def __enter__(self):
+        self._ensure_connected()
+        return self
     
-    def get_games_by_type(self, game_type=None, limit=None):
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _ensure_connected(self):
+        """Connect on first use and keep the connection for later queries."""
+        if not self._connected:
+            self._connected = bool(self.db.connect())
+    
+    def _get_team_names(self):
+        """Return the {team_id: team_name} map, loading it on first use."""
+        if self._team_names is None:
+            self._team_names = dict(self.db.fetch_results("SELECT team_id, team_name FROM teams"))
+        return self._team_names
+    
+    def close(self):
+        """Release the analyzer's database connection."""
+        if self._connected:
+            self.db.disconnect()
+            self._connected = False
+    
+    def get_games_by_type(self, game_type=None, year=None, limit=None):
         """
         Get games filtered by game type.
         
         Args:
             game_type: Game type code ('S', 'R', 'F', 'D', 'L', 'W', 'A') or None for all
-            limit: Maximum number of games to return
+            year: Only return games played in this year (optional)
+            limit: Maximum number of games to return (None for no limit)
         
         Returns:
             List of game records
         """
         try:
-            self.db.connect()
-            
-            base_query = """
-            SELECT g.game_id, g.game_date, g.official_date, g.game_type, g.series_description,
-                   g.game_status, g.home_score, g.away_score,
-                   ht.team_name as home_team, at.team_name as away_team
-            FROM games g
-            LEFT JOIN teams ht ON g.home_team_id = ht.team_id
-            LEFT JOIN teams at ON g.away_team_id = at.team_id
-            """
-            
-            if game_type:
-                query = base_query + " WHERE g.game_type = :game_type"
-                params = {'game_type': game_type}
-            else:
-                query = base_query
-                params = {}
-            
-            query += " ORDER BY g.game_date DESC"
-            
-            if limit:
-                query += f" OFFSET 0 ROWS FETCH NEXT {limit} ROWS ONLY"
-            
+            self._ensure_connected()
+            
+            params = {
+                'game_type': game_type,
+                'date_from': date(year, 1, 1) if year else date.min,
+                'date_to': date(year + 1, 1, 1) if year else date.max,
+                'limit': limit or _NO_LIMIT,
+            }
+            query = GAMES_BY_TYPE_SQL if game_type else ALL_GAMES_SQL
             results = self.db.fetch_results(query, params)
-            return results
+            
+            # Swap the trailing team ids for names (None for unknown teams,
+            # matching the LEFT JOIN this replaces)
+            team_names = self._get_team_names()
+            return [tuple(row[:-2]) + (team_names.get(row[-2]), team_names.get(row[-1]))
+                    for row in results]
             
         except Exception as e:
             print(f"❌ Error fetching games: {e}")
             return []
     
+    def get_spring_training_games(self, year=None, limit=50):
+        """Get spring training games, optionally filtered by year."""
+        return [row[:3] + row[4:] for row in self.get_games_by_type('S', year, limit)]
+    
+    def get_regular_season_games(self, year=None, limit=50):
+        """Get regular season games, optionally filtered by year."""
+        return [row[:3] + row[4:] for row in self.get_games_by_type('R', year, limit)]
+    
     def get_game_type_summary(self):
         """Get a summary of games by type."""
         try:
-            self.db.connect()
+            self._ensure_connected()
             
             query = """
             SELECT game_type, series_description, COUNT(*) as game_count,
@@ -99,7 +148,7 @@ class GameTypeAnalyzer:
             True if preseason, False if regular season, None if not found
         """
         try:
-            self.db.connect()
+            self._ensure_connected()
             
             query = "SELECT game_type FROM games WHERE game_id = :game_id"
             results = self.db.fetch_results(query, {'game_id': game_id})
@@ -113,70 +162,6 @@ class GameTypeAnalyzer:
             print(f"❌ Error checking game type: {e}")
             return None
     
-    def get_spring_training_games(self, year=None, limit=50):
-        """Get spring training games, optionally filtered by year."""
-        try:
-            self.db.connect()
-            
-            query = """
-            SELECT g.game_id, g.game_date, g.official_date, g.series_description,
-                   g.game_status, g.home_score, g.away_score,
-                   ht.team_name as home_team, at.team_name as away_team
-            FROM games g
-            LEFT JOIN teams ht ON g.home_team_id = ht.team_id
-            LEFT JOIN teams at ON g.away_team_id = at.team_id
-            WHERE g.game_type = 'S'
-            """
-            
-            params = {}
-            if year:
-                query += " AND YEAR(g.game_date) = :year"
-                params['year'] = year
-            
-            query += " ORDER BY g.game_date DESC"
-            
-            if limit:
-                query += f" OFFSET 0 ROWS FETCH NEXT {limit} ROWS ONLY"
-            
-            results = self.db.fetch_results(query, params)
-            return results
-            
-        except Exception as e:
-            print(f"❌ Error fetching spring training games: {e}")
-            return []
-    
-    def get_regular_season_games(self, year=None, limit=50):
-        """Get regular season games, optionally filtered by year."""
-        try:
-            self.db.connect()
-            
-            query = """
-            SELECT g.game_id, g.game_date, g.official_date, g.series_description,
-                   g.game_status, g.home_score, g.away_score,
-                   ht.team_name as home_team, at.team_name as away_team
-            FROM games g
-            LEFT JOIN teams ht ON g.home_team_id = ht.team_id
-            LEFT JOIN teams at ON g.away_team_id = at.team_id
-            WHERE g.game_type = 'R'
-            """
-            
-            params = {}
-            if year:
-                query += " AND YEAR(g.game_date) = :year"
-                params['year'] = year
-            
-            query += " ORDER BY g.game_date DESC"
-            
-            if limit:
-                query += f" OFFSET 0 ROWS FETCH NEXT {limit} ROWS ONLY"
-            
-            results = self.db.fetch_results(query, params)
-            return results
-            
-        except Exception as e:
-            print(f"❌ Error fetching regular season games: {e}")
-            return []
-    
     def print_game_type_summary(self):
         """Print a formatted summary of games by type."""
         summary = self.get_game_type_summary()
@@ -207,8 +192,8 @@ class GameTypeAnalyzer:
         This is useful for backfilling game type data.
         """
         try:
-            from api.mlb_client import MLBClient
-            from database.json_to_sql_loader import JsonToSqlLoader
+            from src.api.mlb_client import MLBClient
+            from src.database.json_to_sql_loader import JsonToSqlLoader
             
             client = MLBClient()
             loader = JsonToSqlLoader()
@@ -231,8 +216,8 @@ class GameTypeAnalyzer:
             return False
     
     def __del__(self):
-        if hasattr(self, 'db'):
-            self.db.disconnect()
+        if hasattr(self, '_connected'):
+            self.close()
 
 def main():
     """Demo the game type analyzer."""
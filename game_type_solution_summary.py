@@ -3,11 +3,7 @@
 Game Type Solution Summary
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
 
 def explain_game_type_solution():
     """Explain the game type solution and current status."""
@@ -50,25 +46,30 @@ def explain_game_type_solution():
     try:
         db.connect()
         
-        # Check current game type distribution
+        # Check current game type distribution; ROLLUP appends the grand total
+        # as a final row flagged by GROUPING(game_type) = 1
         result = db.fetch_results("""
-        SELECT game_type, COUNT(*) as count
+        SELECT game_type, COUNT(*) as count, GROUPING(game_type) as is_total
         FROM games 
-        GROUP BY game_type 
-        ORDER BY COUNT(*) DESC
+        GROUP BY ROLLUP(game_type) 
+        ORDER BY GROUPING(game_type), COUNT(*) DESC
         """)
         
         print("Current game_type distribution in database:")
-        total_games = sum(row[1] for row in result)
-        for row in result:
-            game_type, count = row
+        total_games = result[-1][1] if result else 0
+        null_games = 0
+        for game_type, count, is_total in result:
+            if is_total:
+                continue
+            if game_type is None:
+                null_games = count
             percentage = (count / total_games) * 100 if total_games > 0 else 0
             print(f"  {game_type or 'NULL'}: {count} games ({percentage:.1f}%)")
         
         print(f"\nTotal games: {total_games}")
         
         # Check if any new extractions have game type
-        games_with_type = db.fetch_results("SELECT COUNT(*) FROM games WHERE game_type IS NOT NULL")[0][0]
+        games_with_type = total_games - null_games
         print(f"Games with game_type: {games_with_type}")
         
         if games_with_type == 0:
@@ -8,10 +8,11 @@ import sys
 import glob
 from pathlib import Path
 
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+# Add the parent directory (project root) to the path since we're in load-data subdirectory
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from database.connection import DatabaseConnection
-from database.json_to_sql_loader import JSONToSQLLoader
+from src.database.connection import DatabaseConnection
+from src.database.json_to_sql_loader import JSONToSQLLoader
 
 def load_april_data():
     """Load April 2025 data with enhanced batting statistics."""
@@ -3,62 +3,86 @@
 Script to load all March 2025 combined data files into SQL Server database.
 """
 
-import glob
 import os
 import sys
+import argparse
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
+# Add the project root (which holds the src package) to the path since we're
+# in the load-data subdirectory
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
-from src.database.json_to_sql_loader import JSONToSQLLoader
+from src.database.json_to_sql_loader import JSONToSQLLoader, load_files_parallel
+from src.utils.json_handler import find_combined_files, read_json_file, write_json_file
 
-def load_march_data():
-    """Load all March 2025 combined data files to database."""
+MARCH_DIR = 'data/json/2025/03-March'
+
+# File name -> [mtime_ns, size] of every file loaded successfully, so reruns
+# skip files that have not changed since
+MANIFEST_FILE = os.path.join(MARCH_DIR, '.load_manifest.json')
+
+def _file_signature(file_path):
+    """Return the [mtime_ns, size] recorded for a file in the load manifest."""
+    st = os.stat(file_path)
+    return [st.st_mtime_ns, st.st_size]
+
+def read_manifest():
+    """Load the manifest of already-loaded files (empty if missing or unreadable)."""
+    try:
+        return read_json_file(MANIFEST_FILE)
+    except (OSError, ValueError):
+        return {}
+
+def load_march_data(workers=None, force=False):
+    """
+    Load all March 2025 combined data files to database.
+    
+    Args:
+        workers: Number of worker processes loading files concurrently
+            (default: min(8, CPU count))
+        force: Load every file, even those unchanged since they were last loaded
+    """
+    workers = workers or min(8, os.cpu_count() or 1)
     
     # Get all combined data files from March 2025
-    march_files = sorted(glob.glob('data/json/2025/03-March/combined_data_*.json'))
+    march_files = find_combined_files(MARCH_DIR)
+    print(f"🗂️  Found {len(march_files)} combined data files from March 2025")
+    
+    # Skip files whose mtime and size match the last successful load
+    manifest = {} if force else read_manifest()
+    signatures = {file_path: _file_signature(file_path) for file_path in march_files}
+    march_files = [file_path for file_path in march_files
+                   if manifest.get(os.path.basename(file_path)) != signatures[file_path]]
     total_files = len(march_files)
     
-    print(f"🗂️  Found {total_files} combined data files from March 2025")
+    if total_files < len(signatures):
+        print(f"⏭️  Skipping {len(signatures) - total_files} files unchanged since the last load")
+    if not march_files:
+        print("✅ Nothing to load (use --force to reload every file)")
+        return 0, 0
+    
     print(f"🚀 Starting database loading process...")
     print("=" * 60)
     
-    # Initialize the loader
+    # Initialize the loader (used for serial retries)
     loader = JSONToSQLLoader()
     
-    # Counters
-    success_count = 0
-    error_count = 0
+    # Files are independent, so load them across a pool of worker processes
+    loaded_files, failed_files = load_files_parallel(march_files, workers, loader)
+    success_count = len(loaded_files)
+    error_count = len(failed_files)
+    for file_path in failed_files:
+        print(f"   ❌ Failed to load {os.path.basename(file_path)}")
     
-    # Process each file
-    for i, file_path in enumerate(march_files, 1):
-        filename = os.path.basename(file_path)
-        
-        try:
-            print(f"[{i:3d}/{total_files}] Processing {filename}...")
-            
-            # Load the file
-            result = loader.load_json_to_database(file_path)
-            
-            if result:
-                success_count += 1
-                print(f"             ✅ Successfully loaded")
-            else:
-                error_count += 1
-                print(f"             ❌ Failed to load")
-                
-        except Exception as e:
-            error_count += 1
-            print(f"             ❌ Error: {str(e)}")
-        
-        # Progress update every 50 files
-        if i % 50 == 0:
-            print(f"\n📊 Progress Update: {i}/{total_files} processed")
-            print(f"   ✅ Success: {success_count}")
-            print(f"   ❌ Errors: {error_count}")
-            print(f"   📈 Success Rate: {(success_count/i)*100:.1f}%")
-            print("=" * 60)
+    # Record only files whose transaction is known to have committed, so the
+    # next run can skip them (files of a chunk whose worker raised are only
+    # recorded if the serial retry committed them)
+    for file_path in loaded_files:
+        manifest[os.path.basename(file_path)] = signatures[file_path]
+    try:
+        write_json_file(MANIFEST_FILE, manifest)
+    except Exception as e:
+        print(f"⚠️ Could not save load manifest: {e}")
     
     # Final summary
     print(f"\n🎉 Loading Complete!")
@@ -76,4 +100,18 @@ def load_march_data():
     return success_count, error_count
 
 if __name__ == "__main__":
-    load_march_data()
+    parser = argparse.ArgumentParser(description="Load March 2025 combined data files into SQL Server")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help='Number of files loaded concurrently (default: min(8, CPU count))'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reload every file, including those unchanged since the last load'
+    )
+    args = parser.parse_args()
+    
+    load_march_data(workers=args.workers, force=args.force)
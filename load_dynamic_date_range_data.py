@@ -18,7 +18,6 @@ Features:
 - Dry-run mode for preview
 """
 
-import os
 import sys
 import glob
 import argparse
@@ -26,13 +25,11 @@ from datetime import datetime, date, timedelta
 from pathlib import Path
 import time
 
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
-from database.json_to_sql_loader import JSONToSQLLoader
-from etl.extract import extract_season_data, get_games_for_date
-from api.mlb_client import MLBClient
-from utils.json_handler import save_raw_api_data, save_to_json
+from src.database.connection import DatabaseConnection
+from src.database.json_to_sql_loader import JSONToSQLLoader
+from src.etl.extract import extract_season_data, get_games_for_date
+from src.api.mlb_client import MLBClient
+from src.utils.json_handler import save_raw_api_data, save_to_json
 
 def extract_date_from_filename(filename):
     """Extract date from combined_data_*.json filename."""
@@ -3,15 +3,11 @@
 Load May 2025 Data with Enhanced Batting Statistics
 """
 
-import os
-import sys
 import glob
 from pathlib import Path
 
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
-from database.json_to_sql_loader import JSONToSQLLoader
+from src.database.connection import DatabaseConnection
+from src.database.json_to_sql_loader import JSONToSQLLoader
 
 def load_may_data():
     """Load May 2025 data with enhanced batting statistics."""
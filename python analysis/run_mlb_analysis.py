@@ -7,8 +7,9 @@ Execute the MLB season phase analysis SQL query and display results.
 import sys
 from pathlib import Path
 
-# Add src to path - go up one directory to find src
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+# Add the project root (which holds the src package) to the path since we're
+# in the analysis subdirectory
+sys.path.append(str(Path(__file__).resolve().parent.parent))
 
 from src.database.connection import DatabaseConnection
 
@@ -5,12 +5,10 @@ This will reload the boxscore data to populate doubles, triples, and home runs.
 """
 
 import os
-import sys
 import glob
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from database.connection import DatabaseConnection
-from database.json_to_sql_loader import JSONToSQLLoader
+from src.database.connection import DatabaseConnection
+from src.database.json_to_sql_loader import JSONToSQLLoader
 
 def clear_march_boxscore_data():
     """Clear existing March 2025 boxscore data so we can reload with new columns."""
@@ -123,9 +121,11 @@ def reload_march_boxscore_data():
         db.connect()
         
         # Check for non-zero values
-        doubles_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE doubles > 0")[0][0]
-        triples_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE triples > 0")[0][0]
-        hr_count = db.fetch_results("SELECT COUNT(*) FROM boxscore WHERE home_runs > 0")[0][0]
+        doubles_count, triples_count, hr_count = db.fetch_scalars([
+            "SELECT COUNT(*) FROM boxscore WHERE doubles > 0",
+            "SELECT COUNT(*) FROM boxscore WHERE triples > 0",
+            "SELECT COUNT(*) FROM boxscore WHERE home_runs > 0",
+        ])
         
         print(f"   Records with doubles > 0: {doubles_count}")
         print(f"   Records with triples > 0: {triples_count}")
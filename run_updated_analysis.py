@@ -4,12 +4,6 @@ Run Updated MLB Season Phase Analysis
 Execute the MLB season phase analysis including May 2025 data.
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
-
 from src.database.connection import DatabaseConnection
 
 def run_updated_mlb_season_analysis():
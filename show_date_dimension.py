@@ -5,10 +5,6 @@ Display the structure and sample data from the dim_date table.
 """
 
 import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.append(str(Path(__file__).parent / 'src'))
 
 from src.database.connection import DatabaseConnection
 
@@ -37,9 +33,10 @@ def show_date_dimension_details():
         
         print("   Column Name                   Type           Nullable   Length")
         print("   " + "-" * 65)
-        for col_name, data_type, nullable, max_length in structure:
-            length_str = f"({max_length})" if max_length else ""
-            print(f"   {col_name:<30} {data_type:<10}{length_str:<6} {nullable:<8}")
+        print("\n".join(
+            f"   {col_name:<30} {data_type:<10}{f'({max_length})' if max_length else '':<6} {nullable:<8}"
+            for col_name, data_type, nullable, max_length in structure
+        ))
         
         # Sample data for current month
         print(f"\n2. SAMPLE DATA (Current Week):")
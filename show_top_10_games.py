@@ -3,11 +3,7 @@
 Show Top 10 Rows from dbo.games Table
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
 
 def show_top_10_games():
     """Display the top 10 rows from dbo.games table."""
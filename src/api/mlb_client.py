@@ -1,13 +1,23 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class MLBClient:
-    def __init__(self, base_url="https://statsapi.mlb.com/api/v1"):
+    def __init__(self, base_url="https://statsapi.mlb.com/api/v1", pool_size=16):
         self.base_url = base_url
+        
+        # Keep-alive connections shared by every request (and every thread) using
+        # this client, so concurrent fetches skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update({'Accept-Encoding': 'gzip'})
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                                                   max_retries=Retry(total=5, backoff_factor=0.5,
+                                                                     status_forcelist=[429, 502, 503, 504])))
 
     def fetch_boxscore(self, game_id):
         # MLB Stats API endpoint for boxscore
-        response = requests.get(f"{self.base_url}/game/{game_id}/boxscore")
+        response = self.session.get(f"{self.base_url}/game/{game_id}/boxscore")
         if response.status_code == 200:
             return response.json()
         else:
@@ -15,7 +25,7 @@ class MLBClient:
 
     def fetch_game_data(self, game_id):
         # MLB Stats API endpoint for linescore (contains game summary data)
-        response = requests.get(f"{self.base_url}/game/{game_id}/linescore")
+        response = self.session.get(f"{self.base_url}/game/{game_id}/linescore")
         if response.status_code == 200:
             return response.json()
         else:
@@ -23,7 +33,7 @@ class MLBClient:
             
     def fetch_game_feed(self, game_id):
         # MLB Stats API endpoint for complete game feed
-        response = requests.get(f"{self.base_url}/game/{game_id}/feed/live")
+        response = self.session.get(f"{self.base_url}/game/{game_id}/feed/live")
         if response.status_code == 200:
             return response.json()
         else:
@@ -45,7 +55,7 @@ class MLBClient:
             'sportId': sport_id,
             'hydrate': 'team,linescore'
         }
-        response = requests.get(url, params=params)
+        response = self.session.get(url, params=params)
         if response.status_code == 200:
             return response.json()
         else:
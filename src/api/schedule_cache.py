@@ -0,0 +1,60 @@
+import hashlib
+import time
+from datetime import date
+from pathlib import Path
+
+from src.utils.json_handler import read_json_file, write_json_file
+
+CACHE_DIR = Path.home() / ".cache" / "mlb_pipeline" / "schedule"
+
+
+def _cache_file(start_date, end_date, sport_id):
+    """Return the cache file path for one schedule request."""
+    key = hashlib.sha1(f"{start_date}|{end_date}|{sport_id}".encode()).hexdigest()
+    return CACHE_DIR / f"schedule_{key}.json"
+
+
+def fetch_schedule_cached(client, start_date, end_date, sport_id=1, ttl=86400):
+    """
+    Fetch an MLB schedule, reusing a copy saved on disk when it is fresh.
+
+    Only ranges that ended before today are cached: schedules that include
+    today or later dates still change (game status, scores, postponements),
+    so they are always fetched from the API.
+
+    Args:
+        client: MLBClient used when the cache misses
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        sport_id: Sport ID (1 for MLB)
+        ttl: Seconds a cached schedule stays valid
+
+    Returns:
+        Schedule response data
+    """
+    if date.fromisoformat(end_date) >= date.today():
+        return client.fetch_schedule(start_date, end_date, sport_id)
+
+    cache_file = _cache_file(start_date, end_date, sport_id)
+
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            return read_json_file(cache_file)
+    except (OSError, ValueError):
+        pass
+
+    schedule_data = client.fetch_schedule(start_date, end_date, sport_id)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_json_file(cache_file, schedule_data)
+    except Exception as e:
+        print(f"⚠️ Could not save schedule cache: {e}")
+
+    return schedule_data
+
+
+def invalidate():
+    """Delete every cached schedule response."""
+    for cache_file in CACHE_DIR.glob("schedule_*.json"):
+        cache_file.unlink(missing_ok=True)
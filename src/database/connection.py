@@ -1,12 +1,48 @@
+import atexit
 import pyodbc
 import sqlalchemy
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 import os
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Engines (and their connection pools) shared by every DatabaseConnection in
+# this process, keyed by (pid, connection string) so forked workers never reuse
+# a pool inherited from their parent
+_engines = {}
+
+def _get_engine(connection_string):
+    """Return the pooled engine for a connection string, creating it on first use."""
+    key = (os.getpid(), connection_string)
+    engine = _engines.get(key)
+    if engine is None:
+        # fast_executemany makes pyodbc bind execute_many() parameter sets as
+        # one ODBC array instead of a round-trip per row
+        engine = create_engine(connection_string, fast_executemany=True,
+                               pool_pre_ping=True, pool_recycle=1800)
+        event.listen(engine, "connect", _set_nocount)
+        _engines[key] = engine
+    return engine
+
+def _set_nocount(dbapi_connection, connection_record):
+    """
+    Suppress per-statement rowcount messages on a new pooled connection.
+
+    Runs once per DBAPI connection on the raw cursor, so no SQLAlchemy
+    transaction is begun and callers can still open their own with begin().
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("SET NOCOUNT ON")
+    finally:
+        cursor.close()
+
+def _as_statement(query):
+    """Wrap a SQL string in text(); prebuilt text() clauses are passed through as-is."""
+    return text(query) if isinstance(query, str) else query
+
 class DatabaseConnection:
     def __init__(self, server=None, database=None, username=None, password=None):
         """
@@ -45,8 +81,7 @@ class DatabaseConnection:
     def connect(self):
         """Establish a database connection."""
         try:
-            connection_string = self.get_connection_string()
-            self.engine = create_engine(connection_string)
+            self.engine = _get_engine(self.get_connection_string())
             self.connection = self.engine.connect()
             print(f"✅ Connected to SQL Server: {self.server}/{self.database}")
             return self.connection
@@ -55,7 +90,7 @@ class DatabaseConnection:
             return None
 
     def disconnect(self):
-        """Close the database connection."""
+        """Close the database connection (returning it to the engine's pool)."""
         if self.connection:
             self.connection.close()
             print("✅ Database connection closed")
@@ -88,18 +123,34 @@ class DatabaseConnection:
             if not self.connection:
                 self.connect()
             
-            result = self.connection.execute(text(query), params or {})
+            result = self.connection.execute(_as_statement(query), params or {})
             return result
         except Exception as e:
             print(f"❌ Error executing query: {e}")
             raise
 
+    def execute_many(self, query, params_list):
+        """Execute one parameterized query for every parameter set in params_list."""
+        try:
+            if not self.connection:
+                self.connect()
+            
+            result = self.connection.execute(_as_statement(query), params_list)
+            return result
+        except Exception as e:
+            print(f"❌ Error executing batch query: {e}")
+            raise
+
     def execute_transaction(self, queries):
         """Execute multiple queries in a single transaction."""
         try:
             if not self.connection:
                 self.connect()
             
+            # On SQLAlchemy 2.x any earlier statement on this connection has
+            # autobegun a transaction; end it so begin() can start this one
+            if self.connection.in_transaction():
+                self.connection.commit()
             trans = self.connection.begin()
             try:
                 results = []
@@ -127,12 +178,29 @@ class DatabaseConnection:
             if not self.connection:
                 self.connect()
             
-            result = self.connection.execute(text(query), params or {})
+            result = self.connection.execute(_as_statement(query), params or {})
             return result.fetchall()
         except Exception as e:
             print(f"❌ Error fetching results: {e}")
             raise
 
+    def fetch_scalars(self, queries, params=None):
+        """
+        Fetch the scalar results of several queries in a single round-trip.
+        
+        Each query must return exactly one value; they are combined as
+        scalar subqueries of one SELECT so only one statement is sent.
+        
+        Args:
+            queries: List of single-value SQL queries
+            params: Optional parameters shared by all queries
+        
+        Returns:
+            List of values in the same order as queries
+        """
+        sql = "SELECT " + ", ".join(f"({query})" for query in queries)
+        return list(self.fetch_results(sql, params)[0])
+
     def create_tables(self):
         """Create the necessary tables for MLB data."""
         tables_sql = """
@@ -209,6 +277,10 @@ class DatabaseConnection:
             json_data NVARCHAR(MAX),
             extraction_timestamp DATETIME DEFAULT GETDATE()
         );
+
+        -- Serves the loader's raw JSON upsert lookup by game and data type
+        IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name='IX_raw_json_data_game_type')
+        CREATE INDEX IX_raw_json_data_game_type ON raw_json_data (game_id, data_type);
         """
         
         try:
@@ -220,4 +292,21 @@ class DatabaseConnection:
             print("✅ Database tables created successfully")
         except Exception as e:
             print(f"❌ Error creating tables: {e}")
-            raise
\ No newline at end of file
+            raise
+
+
+_shared_connection = None
+
+def get_shared_connection():
+    """
+    Return a process-wide DatabaseConnection, connecting on first use.
+    
+    The connection is closed automatically when the interpreter exits, so
+    callers should not disconnect it themselves.
+    """
+    global _shared_connection
+    if _shared_connection is None:
+        _shared_connection = DatabaseConnection()
+        _shared_connection.connect()
+        atexit.register(_shared_connection.disconnect)
+    return _shared_connection
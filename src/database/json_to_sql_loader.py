@@ -1,19 +1,108 @@
-import json
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
+from sqlalchemy import text
 from src.database.connection import DatabaseConnection
-from src.utils.json_handler import load_from_json
+from src.utils.json_handler import load_from_json, read_json_file, to_json_string
+
+# boxscore column -> MLB API batting stat key
+BOXSCORE_STAT_FIELDS = (
+    ('at_bats', 'atBats'),
+    ('runs', 'runs'),
+    ('hits', 'hits'),
+    ('doubles', 'doubles'),
+    ('triples', 'triples'),
+    ('home_runs', 'homeRuns'),
+    ('rbi', 'rbi'),
+    ('walks', 'walks'),
+    ('strikeouts', 'strikeOuts'),
+)
+
+# Per-row statements are built once at import so each call reuses the same clause
+# Reloading a game updates only the boxscore rows whose values changed; the
+# EXISTS/EXCEPT comparison is NULL-safe, so unchanged rows are not rewritten
+BOXSCORE_UPSERT_SQL = text(f"""
+IF NOT EXISTS (SELECT 1 FROM boxscore WHERE game_id = :game_id AND player_id = :player_id)
+INSERT INTO boxscore (game_id, player_id, team_id, {', '.join(column for column, _ in BOXSCORE_STAT_FIELDS)})
+VALUES (:game_id, :player_id, :team_id, {', '.join(':' + column for column, _ in BOXSCORE_STAT_FIELDS)})
+ELSE
+UPDATE boxscore SET team_id = :team_id, {', '.join(f'{column} = :{column}' for column, _ in BOXSCORE_STAT_FIELDS)}
+WHERE game_id = :game_id AND player_id = :player_id
+  AND EXISTS (SELECT team_id, {', '.join(column for column, _ in BOXSCORE_STAT_FIELDS)}
+              EXCEPT SELECT :team_id, {', '.join(':' + column for column, _ in BOXSCORE_STAT_FIELDS)})
+""")
+
+SCHEDULE_GAME_UPSERT_SQL = text("""
+IF NOT EXISTS (SELECT 1 FROM games WHERE game_id = :game_id)
+INSERT INTO games (game_id, game_date, home_team_id, away_team_id, 
+                  home_score, away_score, inning, inning_state, game_status,
+                  game_type, series_description, official_date)
+VALUES (:game_id, :game_date, :home_team_id, :away_team_id, 
+        :home_score, :away_score, :inning, :inning_state, :game_status,
+        :game_type, :series_description, :official_date)
+ELSE
+UPDATE games SET 
+    game_date = :game_date,
+    home_score = :home_score,
+    away_score = :away_score,
+    inning = :inning,
+    inning_state = :inning_state,
+    game_status = :game_status,
+    game_type = :game_type,
+    series_description = :series_description,
+    official_date = :official_date
+WHERE game_id = :game_id
+""")
+
+# One backup row per game and data type: reloading a game replaces its stored
+# JSON, and leaves the row unwritten when the document has not changed
+RAW_JSON_UPSERT_SQL = text("""
+IF NOT EXISTS (SELECT 1 FROM raw_json_data WHERE game_id = :game_id AND data_type = :data_type)
+INSERT INTO raw_json_data (game_id, data_type, json_data, extraction_timestamp)
+VALUES (:game_id, :data_type, :json_data, :timestamp)
+ELSE
+UPDATE raw_json_data SET json_data = :json_data, extraction_timestamp = :timestamp
+WHERE game_id = :game_id AND data_type = :data_type
+  AND (json_data IS NULL OR json_data <> :json_data)
+""")
+
+# UPDLOCK/HOLDLOCK make the existence check and insert atomic, so two loaders
+# inserting the same new team or player cannot both pass the check
+TEAM_INSERT_SQL = text("""
+IF NOT EXISTS (SELECT 1 FROM teams WITH (UPDLOCK, HOLDLOCK) WHERE team_id = :team_id)
+INSERT INTO teams (team_id, team_name, abbreviation, league, division)
+VALUES (:team_id, :team_name, :abbreviation, :league, :division)
+""")
+
+PLAYER_INSERT_SQL = text("""
+IF NOT EXISTS (SELECT 1 FROM players WITH (UPDLOCK, HOLDLOCK) WHERE player_id = :player_id)
+INSERT INTO players (player_id, player_name, team_id, position)
+VALUES (:player_id, :player_name, :team_id, :position)
+""")
 
 class JSONToSQLLoader:
-    def __init__(self, db_connection=None):
+    def __init__(self, db_connection=None, verbose=True):
         """
         Initialize the JSON to SQL loader.
         
         Args:
             db_connection: DatabaseConnection instance (optional)
+            verbose: Print a line for every file read and loaded (errors are
+                always printed); bulk loaders turn this off to keep console
+                writes out of the per-file loop
         """
         self.db = db_connection or DatabaseConnection()
+        self.verbose = verbose
+        
+        # Team/player ids known to exist in the database, so repeated files
+        # skip the per-row existence check. Ids inserted by the file being
+        # loaded stay pending until that file has loaded successfully.
+        self._seen_teams = set()
+        self._seen_players = set()
+        self._pending_teams = set()
+        self._pending_players = set()
+        self._seen_primed = False
 
     def load_json_to_database(self, json_file_path):
         """
@@ -34,16 +123,18 @@ class JSONToSQLLoader:
                 print("❌ Failed to connect to database")
                 return False
 
-            # Determine the type of JSON file and process accordingly
-            if 'combined_data' in str(json_file_path):
-                return self._load_combined_data(data)
-            elif 'boxscore_raw' in str(json_file_path):
-                return self._load_boxscore_data(data)
-            elif 'game_raw' in str(json_file_path):
-                return self._load_game_data(data)
+            # One transaction per file: every row commits together, or none do
+            trans = self.db.connection.begin()
+            try:
+                result = self._load_file_data(json_file_path, data)
+            except Exception:
+                trans.rollback()
+                raise
+            if result:
+                trans.commit()
             else:
-                print(f"❌ Unknown JSON file type: {json_file_path}")
-                return False
+                trans.rollback()
+            return result
 
         except Exception as e:
             print(f"❌ Error loading JSON to database: {e}")
@@ -51,6 +142,257 @@ class JSONToSQLLoader:
         finally:
             self.db.disconnect()
 
+    def load_json_files(self, json_file_paths, commit_every=50):
+        """
+        Load many JSON files over a single connection with batched commits.
+        
+        Files are loaded commit_every at a time. The teams and players a batch
+        references are inserted and committed first, in a short transaction
+        of their own, so concurrent loaders only briefly hold locks on those
+        shared rows. The batch's games, boxscore and raw JSON rows then commit
+        together; each file runs in its own savepoint, so a bad file only
+        rolls back its own rows. A file only counts as loaded once its batch
+        has committed: if the commit fails, or the transaction is lost (e.g.
+        a deadlock), every file of that batch is reported as failed. The next
+        batch is read and parsed on a background thread while the current one
+        is inserted.
+        
+        Args:
+            json_file_paths: Paths of the JSON files to load
+            commit_every: Number of files per committed transaction
+        
+        Returns:
+            Tuple of (success_count, failed_paths)
+        """
+        json_file_paths = list(json_file_paths)
+        success_count = 0
+        failed_paths = []
+        
+        if not self.db.connect():
+            print("❌ Failed to connect to database")
+            return 0, json_file_paths
+        
+        # One batch of read-ahead: file I/O and parsing overlap the INSERT
+        # round-trips, during which pyodbc releases the GIL
+        reader = ThreadPoolExecutor(max_workers=1)
+        read = load_from_json if self.verbose else read_json_file
+        batches = [json_file_paths[i:i + commit_every]
+                   for i in range(0, len(json_file_paths), commit_every)]
+        
+        try:
+            next_reads = [reader.submit(read, path) for path in batches[0]] if batches else []
+            for b, batch_paths in enumerate(batches):
+                reads = next_reads
+                if b + 1 < len(batches):
+                    next_reads = [reader.submit(read, path) for path in batches[b + 1]]
+                
+                files = []
+                for json_file_path, data_future in zip(batch_paths, reads):
+                    try:
+                        data = data_future.result()
+                    except Exception as e:
+                        print(f"❌ Error reading {json_file_path}: {e}")
+                        data = None
+                    
+                    if data:
+                        files.append((json_file_path, data))
+                    else:
+                        failed_paths.append(json_file_path)
+                
+                try:
+                    self._commit_reference_rows(files)
+                except Exception as e:
+                    print(f"❌ Error inserting teams and players for a batch of {len(files)} files: {e}")
+                    self._seen_primed = False
+                    failed_paths.extend(json_file_path for json_file_path, _ in files)
+                    continue
+                
+                success_count += self._load_batch(files, failed_paths)
+        finally:
+            reader.shutdown(cancel_futures=True)
+            self.db.disconnect()
+        
+        return success_count, failed_paths
+
+    def _load_batch(self, files, failed_paths):
+        """
+        Load a batch of parsed files in one transaction and commit it.
+        
+        Args:
+            files: List of (json_file_path, data) tuples
+            failed_paths: List the paths of files that fail are added to
+        
+        Returns:
+            Number of files committed
+        """
+        batch = []
+        trans = self._begin_batch()
+        for json_file_path, data in files:
+            try:
+                if self._load_file_data(json_file_path, data):
+                    batch.append(json_file_path)
+                else:
+                    failed_paths.append(json_file_path)
+            except Exception as e:
+                # The file's savepoint could not be rolled back, so the
+                # transaction is unusable: the whole batch fails with it
+                print(f"❌ Error loading {json_file_path}, rolling back its batch: {e}")
+                self._abort_batch(trans)
+                failed_paths.extend(batch)
+                failed_paths.append(json_file_path)
+                batch = []
+                trans = self._begin_batch()
+        return self._commit_batch(trans, batch, failed_paths)
+
+    def _commit_reference_rows(self, files):
+        """
+        Insert the teams and players referenced by a batch of files and commit.
+        
+        Rows are written in id order, so loaders running this concurrently
+        take their key locks in the same order instead of deadlocking.
+        
+        Args:
+            files: List of (json_file_path, data) tuples
+        """
+        teams = {}
+        players = {}
+        for json_file_path, data in files:
+            self._collect_reference_rows(json_file_path, data, teams, players)
+        
+        with self.db.connection.begin():
+            if not self._seen_primed:
+                self._prime_seen_keys()
+            
+            new_teams = sorted(team_id for team_id in teams if team_id not in self._seen_teams)
+            new_players = sorted(player_id for player_id in players if player_id not in self._seen_players)
+            if new_teams:
+                self.db.execute_many(TEAM_INSERT_SQL, [self._team_params(teams[team_id]) for team_id in new_teams])
+            if new_players:
+                self.db.execute_many(PLAYER_INSERT_SQL, [self._player_params(*players[player_id])
+                                                         for player_id in new_players])
+        
+        self._seen_teams.update(new_teams)
+        self._seen_players.update(new_players)
+
+    def _collect_reference_rows(self, json_file_path, data, teams, players):
+        """
+        Add the teams and players a file will reference to the given dicts.
+        
+        Args:
+            json_file_path: Path of the file (selects its layout, as in _load_file_data)
+            data: Parsed JSON data
+            teams: Dict of team_id -> team data, updated in place
+            players: Dict of player_id -> (person data, team_id), updated in place
+        """
+        if 'combined_data' in str(json_file_path):
+            game_data, boxscore_data = data.get('game_data') or {}, data.get('boxscore') or {}
+        elif 'boxscore_raw' in str(json_file_path):
+            game_data, boxscore_data = {}, data
+        elif 'game_raw' in str(json_file_path):
+            game_data, boxscore_data = data, {}
+        else:
+            return
+        
+        for team_type in ['home', 'away']:
+            team_info = game_data.get('teams', {}).get(team_type, {}).get('team', {})
+            if team_info.get('id') is not None:
+                teams[team_info['id']] = team_info
+            
+            team_data = boxscore_data.get('teams', {}).get(team_type, {})
+            team_info = team_data.get('team', {})
+            if team_info.get('id') is not None:
+                teams[team_info['id']] = team_info
+            for player_key, player_data in team_data.get('players', {}).items():
+                person = player_data.get('person', {})
+                if player_key.startswith('ID') and person.get('id') is not None:
+                    players[person['id']] = (person, team_info.get('id'))
+
+    def _begin_batch(self):
+        """
+        Open a load_json_files batch transaction.
+        
+        The seen-id caches are loaded inside it, once per loader (or again
+        after a rolled-back batch), and then kept up to date by the loader's
+        own inserts across calls. They must not be queried before begin():
+        on SQLAlchemy 2.x that query would autobegin a transaction and
+        begin() would raise.
+        """
+        trans = self.db.connection.begin()
+        if not self._seen_primed:
+            self._prime_seen_keys()
+        return trans
+
+    def _commit_batch(self, trans, batch, failed_paths):
+        """
+        Commit a load_json_files batch.
+        
+        Returns:
+            Number of files committed (0 if the commit failed, in which case
+            the batch's files are added to failed_paths)
+        """
+        try:
+            trans.commit()
+            return len(batch)
+        except Exception as e:
+            print(f"❌ Error committing batch of {len(batch)} files: {e}")
+            self._abort_batch(trans)
+            failed_paths.extend(batch)
+            return 0
+
+    def _abort_batch(self, trans):
+        """Roll back a failed batch and forget the ids it had inserted."""
+        try:
+            trans.rollback()
+        except Exception as e:
+            print(f"⚠️ Error rolling back batch: {e}")
+        
+        # Ids from the rolled-back files are no longer in the database; the
+        # caches are reloaded when the next batch begins
+        self._seen_primed = False
+
+    def _prime_seen_keys(self):
+        """Load the existing team and player ids in one query per table."""
+        self._seen_teams = {row[0] for row in self.db.fetch_results("SELECT team_id FROM teams")}
+        self._seen_players = {row[0] for row in self.db.fetch_results("SELECT player_id FROM players")}
+        self._seen_primed = True
+
+    def _load_file_data(self, json_file_path, data):
+        """Dispatch parsed JSON data to the loader for its file type."""
+        self._pending_teams.clear()
+        self._pending_players.clear()
+        
+        if 'combined_data' in str(json_file_path):
+            load = self._load_combined_data
+        elif 'boxscore_raw' in str(json_file_path):
+            load = self._load_boxscore_data
+        elif 'game_raw' in str(json_file_path):
+            load = self._load_game_data
+        else:
+            print(f"❌ Unknown JSON file type: {json_file_path}")
+            return False
+        
+        # Every file's rows commit together or not at all; inside a batch
+        # opened by load_json_files (or load_json_to_database) this is a
+        # savepoint, so a failed file leaves no partial rows in the batch
+        connection = self.db.connection
+        begin = connection.begin_nested if connection.in_transaction() else connection.begin
+        trans = begin()
+        try:
+            result = load(data)
+        except Exception:
+            trans.rollback()
+            raise
+        if result:
+            trans.commit()
+        else:
+            trans.rollback()
+        
+        # Only trust ids whose inserts were not rolled back with the file
+        if result:
+            self._seen_teams |= self._pending_teams
+            self._seen_players |= self._pending_players
+        return result
+
     def _load_combined_data(self, data):
         """Load combined JSON data (contains both boxscore and game data)."""
         try:
@@ -64,27 +406,25 @@ class JSONToSQLLoader:
                 'series_description': data.get('series_description')
             }
             
-            # Use a transaction to ensure all data is committed together
-            with self.db.connection.begin() as trans:
-                # First, save raw JSON data for backup
-                self._save_raw_json(game_id, 'combined', json.dumps(data))
-                
-                # Extract and load game data with proper date and metadata
-                if 'game_data' in data:
-                    self._process_game_data(game_id, data['game_data'], game_date, game_metadata)
-                
-                # Extract and load boxscore data
-                if 'boxscore' in data:
-                    self._process_boxscore_data(game_id, data['boxscore'])
-                
-                # Transaction will be committed automatically when exiting the context
+            # First, save raw JSON data for backup (the savepoint opened by
+            # _load_file_data keeps the file's rows together)
+            self._save_raw_json(game_id, 'combined', to_json_string(data))
+            
+            # Extract and load game data with proper date and metadata
+            if 'game_data' in data:
+                self._process_game_data(game_id, data['game_data'], game_date, game_metadata)
+            
+            # Extract and load boxscore data
+            if 'boxscore' in data:
+                self._process_boxscore_data(game_id, data['boxscore'])
             
-            print(f"✅ Successfully loaded combined data for game {game_id}")
+            if self.verbose:
+                print(f"✅ Successfully loaded combined data for game {game_id}")
             return True
             
         except Exception as e:
             print(f"❌ Error processing combined data: {e}")
-            # Transaction will be rolled back automatically on exception
+            # _load_file_data rolls back the file's savepoint
             return False
 
     def _load_boxscore_data(self, data):
@@ -94,12 +434,13 @@ class JSONToSQLLoader:
             game_id = self._extract_game_id_from_data(data)
             
             # Save raw JSON
-            self._save_raw_json(game_id, 'boxscore', json.dumps(data))
+            self._save_raw_json(game_id, 'boxscore', to_json_string(data))
             
             # Process boxscore
             self._process_boxscore_data(game_id, data)
             
-            print(f"✅ Successfully loaded boxscore data for game {game_id}")
+            if self.verbose:
+                print(f"✅ Successfully loaded boxscore data for game {game_id}")
             return True
             
         except Exception as e:
@@ -113,12 +454,13 @@ class JSONToSQLLoader:
             game_id = self._extract_game_id_from_data(data)
             
             # Save raw JSON
-            self._save_raw_json(game_id, 'game_data', json.dumps(data))
+            self._save_raw_json(game_id, 'game_data', to_json_string(data))
             
             # Process game data
             self._process_game_data(game_id, data, None, None)
             
-            print(f"✅ Successfully loaded game data for game {game_id}")
+            if self.verbose:
+                print(f"✅ Successfully loaded game data for game {game_id}")
             return True
             
         except Exception as e:
@@ -126,18 +468,14 @@ class JSONToSQLLoader:
             return False
 
     def _save_raw_json(self, game_id, data_type, json_data):
-        """Save raw JSON data to the database."""
-        query = """
-        INSERT INTO raw_json_data (game_id, data_type, json_data, extraction_timestamp)
-        VALUES (:game_id, :data_type, :json_data, :timestamp)
-        """
+        """Save (or refresh) the raw JSON backup for a game."""
         params = {
             'game_id': game_id,
             'data_type': data_type,
             'json_data': json_data,
             'timestamp': datetime.now()
         }
-        self.db.execute_query(query, params)
+        self.db.execute_query(RAW_JSON_UPSERT_SQL, params)
 
     def _process_game_data(self, game_id, game_data, game_date=None, game_metadata=None):
         """Process and insert game data."""
@@ -164,6 +502,7 @@ class JSONToSQLLoader:
         """Process and insert boxscore data."""
         try:
             teams = boxscore_data.get('teams', {})
+            batting_rows = []
             
             for team_type in ['home', 'away']:
                 team_data = teams.get(team_type, {})
@@ -174,7 +513,8 @@ class JSONToSQLLoader:
                 if team_info:
                     self._insert_team(team_info)
                 
-                # Insert players and their stats
+                # Insert players and collect their stats
+                team_id = team_info.get('id')
                 for player_key, player_data in players.items():
                     if player_key.startswith('ID'):
                         person = player_data.get('person', {})
@@ -182,13 +522,17 @@ class JSONToSQLLoader:
                         
                         # Insert player
                         if person:
-                            self._insert_player(person, team_info.get('id'))
+                            self._insert_player(person, team_id)
                         
-                        # Insert batting stats
+                        # Collect batting stats
                         batting = stats.get('batting', {})
                         if batting:
-                            self._insert_boxscore_stats(game_id, person.get('id'), 
-                                                      team_info.get('id'), batting)
+                            batting_rows.append(
+                                self._boxscore_stats_params(game_id, person.get('id'), team_id, batting))
+            
+            # Upsert every player's batting stats in one batch, after the players exist
+            if batting_rows:
+                self.db.execute_many(BOXSCORE_UPSERT_SQL, batting_rows)
             
         except Exception as e:
             print(f"❌ Error processing boxscore data: {e}")
@@ -196,34 +540,40 @@ class JSONToSQLLoader:
 
     def _insert_team(self, team_data):
         """Insert or update team data."""
-        query = """
-        IF NOT EXISTS (SELECT 1 FROM teams WHERE team_id = :team_id)
-        INSERT INTO teams (team_id, team_name, abbreviation, league, division)
-        VALUES (:team_id, :team_name, :abbreviation, :league, :division)
-        """
-        params = {
+        team_id = team_data.get('id')
+        if team_id in self._seen_teams or team_id in self._pending_teams:
+            return
+        
+        self.db.execute_query(TEAM_INSERT_SQL, self._team_params(team_data))
+        self._pending_teams.add(team_id)
+
+    def _insert_player(self, player_data, team_id):
+        """Insert or update player data."""
+        player_id = player_data.get('id')
+        if player_id in self._seen_players or player_id in self._pending_players:
+            return
+        
+        self.db.execute_query(PLAYER_INSERT_SQL, self._player_params(player_data, team_id))
+        self._pending_players.add(player_id)
+
+    def _team_params(self, team_data):
+        """Build the TEAM_INSERT_SQL parameters for one API team."""
+        return {
             'team_id': team_data.get('id'),
             'team_name': team_data.get('name'),
             'abbreviation': team_data.get('abbreviation'),
             'league': team_data.get('league', {}).get('name'),
             'division': team_data.get('division', {}).get('name')
         }
-        self.db.execute_query(query, params)
 
-    def _insert_player(self, player_data, team_id):
-        """Insert or update player data."""
-        query = """
-        IF NOT EXISTS (SELECT 1 FROM players WHERE player_id = :player_id)
-        INSERT INTO players (player_id, player_name, team_id, position)
-        VALUES (:player_id, :player_name, :team_id, :position)
-        """
-        params = {
+    def _player_params(self, player_data, team_id):
+        """Build the PLAYER_INSERT_SQL parameters for one API person."""
+        return {
             'player_id': player_data.get('id'),
             'player_name': player_data.get('fullName'),
             'team_id': team_id,
             'position': player_data.get('primaryPosition', {}).get('name')
         }
-        self.db.execute_query(query, params)
 
     def _insert_game(self, game_id, game_data, home_team, away_team, game_date=None, game_metadata=None):
         """Insert or update game data."""
@@ -290,28 +640,12 @@ class JSONToSQLLoader:
         }
         self.db.execute_query(query, params)
 
-    def _insert_boxscore_stats(self, game_id, player_id, team_id, batting_stats):
-        """Insert boxscore batting statistics."""
-        query = """
-        IF NOT EXISTS (SELECT 1 FROM boxscore WHERE game_id = :game_id AND player_id = :player_id)
-        INSERT INTO boxscore (game_id, player_id, team_id, at_bats, runs, hits, doubles, triples, home_runs, rbi, walks, strikeouts)
-        VALUES (:game_id, :player_id, :team_id, :at_bats, :runs, :hits, :doubles, :triples, :home_runs, :rbi, :walks, :strikeouts)
-        """
-        params = {
-            'game_id': game_id,
-            'player_id': player_id,
-            'team_id': team_id,
-            'at_bats': batting_stats.get('atBats', 0),
-            'runs': batting_stats.get('runs', 0),
-            'hits': batting_stats.get('hits', 0),
-            'doubles': batting_stats.get('doubles', 0),
-            'triples': batting_stats.get('triples', 0),
-            'home_runs': batting_stats.get('homeRuns', 0),
-            'rbi': batting_stats.get('rbi', 0),
-            'walks': batting_stats.get('walks', 0),
-            'strikeouts': batting_stats.get('strikeOuts', 0)
-        }
-        self.db.execute_query(query, params)
+    def _boxscore_stats_params(self, game_id, player_id, team_id, batting_stats):
+        """Build the BOXSCORE_UPSERT_SQL parameters for one player's batting stats."""
+        params = {'game_id': game_id, 'player_id': player_id, 'team_id': team_id}
+        for column, stat_key in BOXSCORE_STAT_FIELDS:
+            params[column] = batting_stats.get(stat_key, 0)
+        return params
 
     def _extract_game_id_from_data(self, data):
         """Extract game ID from various data structures."""
@@ -496,6 +830,9 @@ class JSONToSQLLoader:
         Load schedule data directly from MLB API response into the games table.
         This populates games with proper metadata including game_type.
         
+        All games are written with one batched upsert inside a single
+        transaction instead of one statement per game.
+        
         Args:
             schedule_data: Schedule data from MLB API
             
@@ -506,38 +843,44 @@ class JSONToSQLLoader:
             if not self.db.connect():
                 print("❌ Failed to connect to database")
                 return False
-                
-            games_loaded = 0
             
-            # Process each date in the schedule
-            for date_entry in schedule_data.get('dates', []):
-                game_date = date_entry.get('date')
-                games = date_entry.get('games', [])
+            self._pending_teams.clear()
+            game_rows = []
+            
+            with self.db.connection.begin():
+                # Process each date in the schedule
+                for date_entry in schedule_data.get('dates', []):
+                    game_date = date_entry.get('date')
+                    games = date_entry.get('games', [])
+                    
+                    print(f"📅 Processing {len(games)} games for {game_date}")
+                    
+                    for game in games:
+                        try:
+                            # Extract game information
+                            game_id = game.get('gamePk')
+                            home_team = game.get('teams', {}).get('home', {}).get('team', {})
+                            away_team = game.get('teams', {}).get('away', {}).get('team', {})
+                            
+                            # Insert teams if they don't exist
+                            if home_team:
+                                self._insert_team(home_team)
+                            if away_team:
+                                self._insert_team(away_team)
+                            
+                            # Collect the game's schedule metadata for the batched upsert
+                            game_rows.append(self._schedule_game_params(game_id, game, game_date))
+                            
+                        except Exception as e:
+                            print(f"❌ Error processing game {game.get('gamePk')}: {e}")
+                            continue
                 
-                print(f"📅 Processing {len(games)} games for {game_date}")
-                
-                for game in games:
-                    try:
-                        # Extract game information
-                        game_id = game.get('gamePk')
-                        home_team = game.get('teams', {}).get('home', {}).get('team', {})
-                        away_team = game.get('teams', {}).get('away', {}).get('team', {})
-                        
-                        # Insert teams if they don't exist
-                        if home_team:
-                            self._insert_team(home_team)
-                        if away_team:
-                            self._insert_team(away_team)
-                        
-                        # Insert/update game with schedule metadata
-                        self._insert_game_from_schedule(game_id, game, game_date)
-                        games_loaded += 1
-                        
-                    except Exception as e:
-                        print(f"❌ Error processing game {game.get('gamePk')}: {e}")
-                        continue
+                # Insert/update every game in one round-trip
+                if game_rows:
+                    self.db.execute_many(SCHEDULE_GAME_UPSERT_SQL, game_rows)
             
-            print(f"✅ Successfully loaded {games_loaded} games from schedule")
+            self._seen_teams |= self._pending_teams
+            print(f"✅ Successfully loaded {len(game_rows)} games from schedule")
             return True
             
         except Exception as e:
@@ -546,8 +889,8 @@ class JSONToSQLLoader:
         finally:
             self.db.disconnect()
     
-    def _insert_game_from_schedule(self, game_id, game_data, game_date):
-        """Insert or update game data from schedule API."""
+    def _schedule_game_params(self, game_id, game_data, game_date):
+        """Build the SCHEDULE_GAME_UPSERT_SQL parameters for one schedule API game."""
         # Parse game date
         if isinstance(game_date, str):
             parsed_date = datetime.strptime(game_date, '%Y-%m-%d').date()
@@ -568,29 +911,7 @@ class JSONToSQLLoader:
         status = game_data.get('status', {})
         game_status = status.get('detailedState', status.get('abstractGameState', 'Unknown'))
         
-        query = """
-        IF NOT EXISTS (SELECT 1 FROM games WHERE game_id = :game_id)
-        INSERT INTO games (game_id, game_date, home_team_id, away_team_id, 
-                          home_score, away_score, inning, inning_state, game_status,
-                          game_type, series_description, official_date)
-        VALUES (:game_id, :game_date, :home_team_id, :away_team_id, 
-                :home_score, :away_score, :inning, :inning_state, :game_status,
-                :game_type, :series_description, :official_date)
-        ELSE
-        UPDATE games SET 
-            game_date = :game_date,
-            home_score = :home_score,
-            away_score = :away_score,
-            inning = :inning,
-            inning_state = :inning_state,
-            game_status = :game_status,
-            game_type = :game_type,
-            series_description = :series_description,
-            official_date = :official_date
-        WHERE game_id = :game_id
-        """
-        
-        params = {
+        return {
             'game_id': game_id,
             'game_date': parsed_date,
             'home_team_id': home_team.get('id'),
@@ -604,5 +925,77 @@ class JSONToSQLLoader:
             'series_description': game_data.get('seriesDescription'),
             'official_date': game_data.get('officialDate')
         }
-        
-        self.db.execute_query(query, params)
+
+
+# Number of files committed together in one transaction by load_files_parallel
+COMMIT_BATCH = 50
+
+# Loader owned by each load_files_parallel worker process (one DB connection per worker)
+_worker_loader = None
+
+def _init_worker():
+    """Create the per-process JSON loader (quiet; progress is reported per chunk)."""
+    global _worker_loader
+    _worker_loader = JSONToSQLLoader(verbose=False)
+
+def _load_chunk(file_paths):
+    """Load a chunk of JSON files in a worker process."""
+    return _worker_loader.load_json_files(file_paths, commit_every=COMMIT_BATCH)
+
+def load_files_parallel(files, workers=None, loader=None):
+    """
+    Load independent JSON files across a pool of worker processes.
+    
+    Each worker task loads COMMIT_BATCH files with JSONToSQLLoader.load_json_files
+    (one connection, batched inserts, one commit per chunk). Shared team and
+    player rows are committed separately ahead of each chunk, so workers do
+    not wait on each other's open chunk transactions. Files that fail,
+    including every file of a chunk whose worker raised, are retried once
+    serially.
+    
+    Args:
+        files: Paths of the JSON files to load
+        workers: Number of worker processes (default: min(8, CPU count))
+        loader: JSONToSQLLoader used for the serial retry (optional)
+    
+    Returns:
+        Tuple of (loaded_paths, failed_paths). loaded_paths only holds files
+        whose transaction is known to have committed.
+    """
+    files = [str(file_path) for file_path in files]
+    workers = workers or min(8, os.cpu_count() or 1)
+    chunks = [files[i:i + COMMIT_BATCH] for i in range(0, len(files), COMMIT_BATCH)]
+    
+    loaded = []
+    failed = []
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(_load_chunk, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            chunk = futures[future]
+            done += len(chunk)
+            try:
+                _, chunk_failed = future.result()
+            except Exception as e:
+                # The worker's state is unknown, so none of the chunk counts as loaded
+                print(f"   ❌ Error loading chunk starting at {os.path.basename(chunk[0])}: {e}")
+                failed.extend(chunk)
+            else:
+                chunk_failed = set(chunk_failed)
+                loaded.extend(path for path in chunk if path not in chunk_failed)
+                failed.extend(path for path in chunk if path in chunk_failed)
+            print(f"   [{done}/{len(files)}] Processed chunk ending at {os.path.basename(chunk[-1])}")
+    
+    still_failed = []
+    if failed:
+        print(f"   Retrying {len(failed)} failed files serially...")
+        loader = loader or JSONToSQLLoader(verbose=False)
+        try:
+            _, still_failed = loader.load_json_files(failed, commit_every=COMMIT_BATCH)
+        except Exception as e:
+            print(f"   ❌ Error retrying failed files: {e}")
+            still_failed = failed
+        retried_failed = set(still_failed)
+        loaded.extend(path for path in failed if path not in retried_failed)
+    
+    return loaded, still_failed
@@ -0,0 +1,73 @@
+import os
+import pickle
+import time
+from pathlib import Path
+
+CACHE_FILE = Path.home() / ".cache" / "mlb_pipeline" / "schema.pkl"
+
+_cache = None
+
+
+def _load_cache():
+    """Load the on-disk schema cache the first time it is needed."""
+    global _cache
+    if _cache is None:
+        try:
+            with open(CACHE_FILE, 'rb') as f:
+                _cache = pickle.load(f)
+        except Exception:
+            _cache = {}
+    return _cache
+
+
+def _save_cache():
+    """Persist the schema cache to disk."""
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, 'wb') as f:
+            pickle.dump(_cache, f)
+    except Exception as e:
+        print(f"⚠️ Could not save schema cache: {e}")
+
+
+def get_columns(db, table, ttl=300):
+    """
+    Get the column definitions of a table, using a cached copy when fresh.
+
+    Args:
+        db: DatabaseConnection instance
+        table: Table name
+        ttl: Seconds a cached entry stays valid
+
+    Returns:
+        List of (COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT) tuples
+        in ordinal order
+    """
+    cache = _load_cache()
+    key = (db.server, db.database, table)
+
+    entry = cache.get(key)
+    if entry and time.time() - entry[0] < ttl:
+        return entry[1]
+
+    result = db.fetch_results("""
+    SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE, COLUMN_DEFAULT
+    FROM INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_NAME = :table
+    ORDER BY ORDINAL_POSITION
+    """, {'table': table})
+    columns = [tuple(row) for row in result]
+
+    cache[key] = (time.time(), columns)
+    _save_cache()
+    return columns
+
+
+def invalidate():
+    """Drop all cached schema information, e.g. after running DDL."""
+    global _cache
+    _cache = {}
+    try:
+        os.remove(CACHE_FILE)
+    except FileNotFoundError:
+        pass
@@ -1,16 +1,29 @@
 from src.api.mlb_client import MLBClient
 from src.utils.json_handler import save_raw_api_data, save_to_json
+from src.utils.rate_limiter import TokenBucket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta, date
-import time
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+SCHEDULE_URL = "https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={}"
+
+# Keep-alive session shared by the schedule lookups below; transient API errors
+# and rate limiting are retried with backoff instead of failing the date
+_session = requests.Session()
+_session.headers.update({'Accept-Encoding': 'gzip'})
+_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=16,
+                                       max_retries=Retry(total=5, backoff_factor=0.5,
+                                                         status_forcelist=[429, 502, 503, 504])))
 
 def get_current_games():
     """Get today's games to find a valid game ID"""
     today = datetime.now().strftime('%Y-%m-%d')
-    url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={today}"
+    url = SCHEDULE_URL.format(today)
     try:
-        response = requests.get(url)
+        response = _session.get(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
             if data.get('dates') and len(data['dates']) > 0 and data['dates'][0].get('games'):
@@ -26,9 +39,9 @@ def get_games_for_date(target_date):
     else:
         date_str = target_date
     
-    url = f"https://statsapi.mlb.com/api/v1/schedule?sportId=1&date={date_str}"
+    url = SCHEDULE_URL.format(date_str)
     try:
-        response = requests.get(url)
+        response = _session.get(url, timeout=10)
         if response.status_code == 200:
             data = response.json()
             if data.get('dates') and len(data['dates']) > 0 and data['dates'][0].get('games'):
@@ -61,8 +74,65 @@ def get_season_date_range(year=None):
     
     return season_start, season_end
 
+def _extract_game(client, game, year, game_date, save_json, rate_limiter=None):
+    """
+    Fetch and save one game's boxscore and linescore (runs on a worker thread).
+    
+    Args:
+        rate_limiter: Optional TokenBucket shared by all workers; one token is
+            taken per game before calling the API
+    
+    Returns:
+        Number of JSON files saved, or None if the API returned no data
+    """
+    game_id = game['gamePk']
+    date_str = game_date.strftime('%Y-%m-%d')
+    
+    # Be respectful to the API: wait only when the shared request budget is spent
+    if rate_limiter is not None:
+        rate_limiter.acquire()
+    
+    # Extract game data
+    boxscore_data = client.fetch_boxscore(game_id)
+    game_data = client.fetch_game_data(game_id)
+    
+    if not (boxscore_data and game_data):
+        return None
+    
+    saved_count = 0
+    
+    # Save to JSON files if requested
+    if save_json:
+        # Create date-specific directory
+        date_dir = f"data/json/{year}/{game_date.strftime('%m-%B')}"
+        
+        saved_files = save_raw_api_data(boxscore_data, game_data, game_id, date_dir)
+        saved_count += len(saved_files)
+        
+        # Save combined file with additional metadata
+        combined_data = {
+            "game_id": game_id,
+            "game_date": date_str,
+            "extraction_timestamp": datetime.now().isoformat(),
+            "home_team": game['home_team'],
+            "away_team": game['away_team'],
+            "game_status": game['status'],
+            "game_type": game.get('gameType'),  # Include game type from schedule
+            "official_date": game.get('officialDate'),  # Include official date
+            "series_description": game.get('seriesDescription'),  # Include series description
+            "boxscore": boxscore_data,
+            "game_data": game_data
+        }
+        
+        combined_path = save_to_json(combined_data, f"combined_data_{game_id}_{date_str.replace('-', '')}", date_dir)
+        if combined_path:
+            saved_count += 1
+    
+    return saved_count
+
 def extract_season_data(year=None, start_date=None, end_date=None, 
-                       save_json=True, delay_seconds=1, max_games_per_day=None):
+                       save_json=True, delay_seconds=1, max_games_per_day=None,
+                       concurrency=1):
     """
     Extract data for an entire MLB season by iterating through each day.
     
@@ -71,8 +141,11 @@ def extract_season_data(year=None, start_date=None, end_date=None,
         start_date: Custom start date (YYYY-MM-DD string or date object)
         end_date: Custom end date (YYYY-MM-DD string or date object)
         save_json: Whether to save JSON files
-        delay_seconds: Delay between API calls to be respectful
+        delay_seconds: Delay between API calls to be respectful (games are
+            started at most once per delay_seconds, however many workers run)
         max_games_per_day: Limit games per day (useful for testing)
+        concurrency: Number of games fetched at the same time (overlaps
+            request latency; does not raise the rate set by delay_seconds)
     
     Returns:
         Dictionary with extraction statistics
@@ -107,6 +180,13 @@ def extract_season_data(year=None, start_date=None, end_date=None,
     
     current_date = start_date
     client = MLBClient()
+    executor = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    
+    # One token bucket shared by all workers caps the total rate at one game
+    # per delay_seconds, without sleeping when a game already took that long
+    rate_limiter = None
+    if delay_seconds > 0:
+        rate_limiter = TokenBucket(rate=1 / delay_seconds, capacity=1)
     
     while current_date <= end_date:
         stats['total_days'] += 1
@@ -127,65 +207,40 @@ def extract_season_data(year=None, start_date=None, end_date=None,
             
             print(f"   Found {len(games)} game(s)")
             
-            for i, game in enumerate(games, 1):
+            # Fetch the day's games concurrently; results are reported in schedule order
+            futures = [
+                executor.submit(_extract_game, client, game, year, current_date, save_json, rate_limiter)
+                if game['status'] in ['Final', 'Live', 'In Progress'] else None
+                for game in games
+            ]
+            
+            for i, (game, future) in enumerate(zip(games, futures), 1):
                 game_id = game['gamePk']
                 status = game['status']
                 
                 print(f"   [{i}/{len(games)}] Game {game_id}: {game['away_team']} @ {game['home_team']} ({status})")
                 
                 # Only extract data for completed games or games in progress
-                if status in ['Final', 'Live', 'In Progress']:
-                    try:
-                        # Extract game data
-                        boxscore_data = client.fetch_boxscore(game_id)
-                        game_data = client.fetch_game_data(game_id)
-                        
-                        if boxscore_data and game_data:
-                            stats['games_extracted'] += 1
-                            
-                            # Save to JSON files if requested
-                            if save_json:
-                                # Create date-specific directory
-                                date_dir = f"data/json/{year}/{current_date.strftime('%m-%B')}"
-                                
-                                saved_files = save_raw_api_data(boxscore_data, game_data, game_id, date_dir)
-                                stats['json_files_saved'] += len(saved_files)
-                                
-                                # Save combined file with additional metadata
-                                combined_data = {
-                                    "game_id": game_id,
-                                    "game_date": date_str,
-                                    "extraction_timestamp": datetime.now().isoformat(),
-                                    "home_team": game['home_team'],
-                                    "away_team": game['away_team'],
-                                    "game_status": status,
-                                    "game_type": game.get('gameType'),  # Include game type from schedule
-                                    "official_date": game.get('officialDate'),  # Include official date
-                                    "series_description": game.get('seriesDescription'),  # Include series description
-                                    "boxscore": boxscore_data,
-                                    "game_data": game_data
-                                }
-                                
-                                combined_path = save_to_json(combined_data, f"combined_data_{game_id}_{date_str.replace('-', '')}", date_dir)
-                                if combined_path:
-                                    stats['json_files_saved'] += 1
-                            
-                            print(f"      ✅ Extracted successfully")
-                        else:
-                            stats['games_failed'] += 1
-                            stats['failed_games'].append({'game_id': game_id, 'date': date_str, 'reason': 'No data returned'})
-                            print(f"      ❌ No data returned")
+                if future is None:
+                    print(f"      ⏭️  Skipped (status: {status})")
+                    continue
+                
+                try:
+                    saved_count = future.result()
                     
-                    except Exception as e:
+                    if saved_count is not None:
+                        stats['games_extracted'] += 1
+                        stats['json_files_saved'] += saved_count
+                        print(f"      ✅ Extracted successfully")
+                    else:
                         stats['games_failed'] += 1
-                        stats['failed_games'].append({'game_id': game_id, 'date': date_str, 'reason': str(e)})
-                        print(f"      ❌ Error: {e}")
-                else:
-                    print(f"      ⏭️  Skipped (status: {status})")
+                        stats['failed_games'].append({'game_id': game_id, 'date': date_str, 'reason': 'No data returned'})
+                        print(f"      ❌ No data returned")
                 
-                # Be respectful to the API
-                if delay_seconds > 0:
-                    time.sleep(delay_seconds)
+                except Exception as e:
+                    stats['games_failed'] += 1
+                    stats['failed_games'].append({'game_id': game_id, 'date': date_str, 'reason': str(e)})
+                    print(f"      ❌ Error: {e}")
         else:
             print(f"   No games found")
         
@@ -199,6 +254,8 @@ def extract_season_data(year=None, start_date=None, end_date=None,
             print(f"   Games extracted: {stats['games_extracted']}/{stats['total_games_found']}")
             print(f"   JSON files saved: {stats['json_files_saved']}")
     
+    executor.shutdown()
+    
     # Final statistics
     stats['extraction_end_time'] = datetime.now()
     stats['total_duration'] = stats['extraction_end_time'] - stats['extraction_start_time']
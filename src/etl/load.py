@@ -1,5 +1,5 @@
 def load_data(transformed_data):
-    from database.connection import DatabaseConnection
+    from src.database.connection import DatabaseConnection
 
     db_connection = DatabaseConnection()
     connection = db_connection.connect()
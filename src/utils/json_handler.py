@@ -1,8 +1,14 @@
 import json
+import mmap
 import os
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def save_to_json(data, filename, directory="data/json"):
     """
     Save data to a JSON file in the specified directory.
@@ -25,8 +31,7 @@ def save_to_json(data, filename, directory="data/json"):
     file_path = Path(directory) / full_filename
     
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json_file(file_path, data)
         print(f"✅ Data saved to: {file_path}")
         return str(file_path)
     except Exception as e:
@@ -44,14 +49,59 @@ def load_from_json(file_path):
         The loaded data or None if error
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json_file(file_path)
         print(f"✅ Data loaded from: {file_path}")
         return data
     except Exception as e:
         print(f"❌ Error loading JSON file: {e}")
         return None
 
+def read_json_file(file_path):
+    """
+    Parse a JSON file without the logging done by load_from_json.
+    
+    Uses orjson over a memory-mapped view of the file when orjson is
+    installed, otherwise falls back to the standard library parser.
+    
+    Args:
+        file_path: Path to the JSON file
+    
+    Returns:
+        The parsed data
+    """
+    if orjson is None:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b'')  # raises the usual decode error
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
+
+def find_combined_files(directory):
+    """
+    List the combined_data_*.json files in a directory, sorted by name.
+    
+    Uses os.scandir so no Path objects or extra stat calls are made per entry.
+    
+    Args:
+        directory: Directory to scan (missing directories yield no files)
+    
+    Returns:
+        Sorted list of file path strings
+    """
+    if not os.path.isdir(directory):
+        return []
+    with os.scandir(directory) as entries:
+        return sorted(entry.path for entry in entries
+                      if entry.name.startswith("combined_data_") and entry.name.endswith(".json")
+                      and entry.is_file())
+
 def save_raw_api_data(boxscore_data, game_data, game_id, directory="data/json"):
     """
     Save raw API data to JSON files.
@@ -75,3 +125,39 @@ def save_raw_api_data(boxscore_data, game_data, game_id, directory="data/json"):
             saved_files.append(file_path)
     
     return saved_files
+
+def write_json_file(file_path, data, default=None):
+    """
+    Write data as indented UTF-8 JSON without the logging done by save_to_json.
+    
+    Uses orjson (serialized to one bytes object and written at once) when
+    orjson is installed, otherwise falls back to the standard library.
+    
+    Args:
+        file_path: Path of the file to write
+        data: The data to save
+        default: Optional callable for objects JSON cannot serialize natively
+    """
+    if orjson is None:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=default)
+        return
+    
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2))
+
+def to_json_string(data):
+    """
+    Serialize data to a compact JSON string.
+    
+    Uses orjson when installed, otherwise falls back to the standard library.
+    
+    Args:
+        data: The data to serialize
+    
+    Returns:
+        JSON text as a str
+    """
+    if orjson is None:
+        return json.dumps(data)
+    return orjson.dumps(data).decode('utf-8')
@@ -0,0 +1,40 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. acquire()
+    returns immediately while tokens are available and only sleeps for the
+    deficit when the bucket is empty, so callers run at the allowed rate
+    instead of pausing a fixed time after every request.
+    """
+
+    def __init__(self, rate, capacity=1):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held (largest burst allowed)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, waiting until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+
+            # Reserve the token now (the balance may go negative) so waiting
+            # threads queue up behind each other instead of racing
+            self._tokens -= 1
+            deficit = -self._tokens
+
+        if deficit > 0:
+            time.sleep(deficit / self.rate)
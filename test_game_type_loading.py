@@ -4,12 +4,10 @@ Test Game Type Extraction and Loading
 """
 
 import os
-import sys
 import json
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from database.connection import DatabaseConnection
-from database.json_to_sql_loader import JSONToSQLLoader
+from src.database.connection import DatabaseConnection
+from src.database.json_to_sql_loader import JSONToSQLLoader
 
 def test_game_type_loading():
     """Test if game type can be extracted and loaded properly."""
@@ -3,12 +3,7 @@
 Test Regular Season vs Spring Training Game Types
 """
 
-import os
-import sys
-
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from api.mlb_client import MLBClient
+from src.api.mlb_client import MLBClient
 
 def test_game_types():
     """Test different game types to understand the patterns."""
@@ -3,14 +3,10 @@
 Test MLB API Schedule Response to Find Game Type Information
 """
 
-import os
-import sys
 import json
 from datetime import datetime
 
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from api.mlb_client import MLBClient
+from src.api.mlb_client import MLBClient
 
 def test_schedule_api():
     """Test the MLB schedule API to see what game type information is available."""
@@ -4,11 +4,10 @@ Update Boxscore Schema
 Adds doubles, triples, and home_runs columns to the existing boxscore table.
 """
 
-import os
 import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
+from src.database import schema_cache
 
 def update_boxscore_schema():
     """Add new columns to boxscore table if they don't exist."""
@@ -56,15 +55,41 @@ def update_boxscore_schema():
         BEGIN
             PRINT 'Home_runs column already exists in boxscore table';
         END
+        """,
+        
+        # Add persisted extra_base_hits column and an index to serve TOP-N lookups.
+        # Filtered indexes cannot reference computed columns, so the index is unfiltered.
+        """
+        IF NOT EXISTS (SELECT * FROM INFORMATION_SCHEMA.COLUMNS
+                       WHERE TABLE_NAME = 'boxscore' AND COLUMN_NAME = 'extra_base_hits')
+        BEGIN
+            ALTER TABLE boxscore ADD extra_base_hits AS (ISNULL(doubles, 0) + ISNULL(triples, 0) + ISNULL(home_runs, 0)) PERSISTED;
+            PRINT 'Added extra_base_hits column to boxscore table';
+        END
+        ELSE
+        BEGIN
+            PRINT 'Extra_base_hits column already exists in boxscore table';
+        END
+        
+        IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_boxscore_xbh')
+        BEGIN
+            EXEC('CREATE INDEX IX_boxscore_xbh ON boxscore(extra_base_hits DESC)
+                  INCLUDE (game_id, player_id, at_bats, hits, doubles, triples, home_runs, rbi)');
+            PRINT 'Created IX_boxscore_xbh index on boxscore table';
+        END
         """
     ]
     
     try:
         print("Updating boxscore table schema...")
         
-        for i, update_sql in enumerate(updates, 1):
-            print(f"Executing update {i}/3...")
-            db.execute_query(update_sql)
+        # The batches start with IF, which SQLAlchemy does not autocommit, so
+        # run them in an explicit transaction to make sure the DDL is committed
+        print(f"Executing {len(updates)} updates...")
+        db.execute_transaction(updates)
+        
+        # Cached column lists for boxscore are stale once the DDL has committed
+        schema_cache.invalidate()
         
         # Verify the schema
         verify_sql = """
@@ -82,12 +107,10 @@ def update_boxscore_schema():
         print(f"{'Column Name':<15} {'Data Type':<12} {'Nullable':<10} {'Default':<10}")
         print("-" * 60)
         
-        for row in result:
-            column_name = row[0]
-            data_type = row[1]
-            is_nullable = row[2]
-            column_default = row[3] if row[3] else ''
-            print(f"{column_name:<15} {data_type:<12} {is_nullable:<10} {column_default:<10}")
+        print("\n".join(
+            f"{column_name:<15} {data_type:<12} {is_nullable:<10} {column_default or '':<10}"
+            for column_name, data_type, is_nullable, column_default in result
+        ))
         
         print(f"\nSchema update completed successfully!")
         print(f"Total columns in boxscore table: {len(result)}")
@@ -4,12 +4,8 @@ Update Game Types for March 2025 Data
 Fetches schedule data and updates existing games with game type information.
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from api.mlb_client import MLBClient
-from database.json_to_sql_loader import JSONToSQLLoader
+from src.api.mlb_client import MLBClient
+from src.database.json_to_sql_loader import JSONToSQLLoader
 
 def update_march_2025_game_types():
     """Update game type information for March 2025 games."""
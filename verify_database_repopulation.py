@@ -3,11 +3,7 @@
 Verify Database Repopulation - March and April 2025 Data
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
 
 def verify_database_repopulation():
     """Verify the database was properly repopulated with March and April data."""
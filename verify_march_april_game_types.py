@@ -3,11 +3,7 @@
 Verify March and April 2025 Game Type Data
 """
 
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from database.connection import DatabaseConnection
+from src.database.connection import DatabaseConnection
 
 def verify_march_april_game_types():
     """Verify that March and April 2025 games have proper game type data."""